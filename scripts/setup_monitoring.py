@@ -71,6 +71,35 @@ def setup_monitoring_schema():
             )
         """)
         
+        # One-time alerts migration, kept out of the detectors' per-run path
+        # since SET LOGGED and DROP CONSTRAINT take ACCESS EXCLUSIVE locks:
+        # alerts carry resolution state, so repair tables created UNLOGGED
+        cursor.execute("ALTER TABLE monitoring.alerts SET LOGGED")
+        
+        # The old detector per-timestamp UNIQUE never fired (alert_timestamp
+        # defaults to CURRENT_TIMESTAMP); dedup detector alerts per minute instead
+        cursor.execute("""
+            ALTER TABLE monitoring.alerts
+                DROP CONSTRAINT IF EXISTS alerts_alert_type_source_table_alert_timestamp_key
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_alerts_dedup
+                ON monitoring.alerts (alert_type, source_table, date_trunc('minute', alert_timestamp))
+                WHERE alert_type IN ('VOLUME_ANOMALY', 'STALE_DATA_FLOW')
+        """)
+        
+        # Alerts are append-only in timestamp order; BRIN serves time-range scans
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_timestamp_brin
+                ON monitoring.alerts USING BRIN (alert_timestamp)
+        """)
+        
+        # Serve "latest alerts of a type" lookups as an index range scan
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alerts_type_timestamp
+                ON monitoring.alerts (alert_type, alert_timestamp DESC)
+        """)
+        
         # Create dim_orders_history table for testing
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS dim_orders_history (
@@ -94,6 +123,12 @@ def setup_monitoring_schema():
             )
         """)
         
+        # Index the ingestion timestamp used by the profiler's hourly window scans
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_dim_orders_history_created_at
+                ON dim_orders_history (created_at)
+        """)
+        
         conn.commit()
         cursor.close()
         conn.close()
@@ -16,13 +16,25 @@ import json
 import psycopg2
 from psycopg2 import sql
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, Callable
 import os
 import random
 import re
 from pathlib import Path
 from termcolor import colored, cprint
 
+# Python value type -> contract type name, for reporting the actual type of a
+# mismatched value in the same vocabulary as the contract's expected type
+_PY2CONTRACT = {
+    str: 'string',
+    int: 'integer',
+    float: 'float',
+    bool: 'boolean',
+    list: 'array',
+    dict: 'object'
+}
+
 
 class ContractViolationBanner:
     """Alert banner for contract violations"""
@@ -132,6 +144,7 @@ class ContractValidator:
     def __init__(self, contract_config: Dict):
         self.contract = contract_config
         self.logger = self._setup_logger()
+        self._compile_contract()
         
     def _setup_logger(self) -> logging.Logger:
         """Setup structured logging for validation operations"""
@@ -148,83 +161,144 @@ class ContractValidator:
             
         return logger
     
-    def get_python_type(self, contract_type: str) -> type:
-        """Convert contract type to Python type"""
-        type_mapping = {
-            'string': str,
-            'integer': int,
-            'float': float,
-            'boolean': bool,
-            'datetime': str,  # ISO string representation
-            'array': list,
-            'object': dict
+    def _compile_contract(self) -> None:
+        """
+        Precompute the per-field validators from the contract
+        
+        Built once per validator so validate_record dispatches on a
+        specialized check per field instead of re-walking the contract and
+        re-resolving types for every record.
+        """
+        required_fields = self.contract.get('required_fields', {})
+        optional_fields = self.contract.get('optional_fields', {})
+        
+        # (expected python type, value type) -> isinstance result; the contract
+        # types are builtins, so the answer depends only on the value's type
+        self._type_match_cache: Dict[Tuple[type, type], bool] = {}
+        
+        self._required_fields = dict(required_fields)
+        self._field_checks = {
+            field_name: (field_config, self._compile_field_validator(field_name, field_config))
+            for field_name, field_config in {**required_fields, **optional_fields}.items()
         }
-        return type_mapping.get(contract_type.lower(), str)
+        
+        self._detect_new_fields = self.contract.get('validation_rules', {}).get(
+            'schema_drift', {}).get('detect_new_fields', True)
     
-    def validate_field_type(self, field_name: str, field_value: Any, field_config: Dict) -> List[str]:
+    def _compile_field_validator(self, field_name: str, field_config: Dict) -> Callable[[Any], List[str]]:
         """
-        Validate field type and constraints
+        Specialize validation for one contract field
         
-        Detection Logic: Strict type validation with constraint checking
-        Returns: List of validation error messages
+        Type, nullability and constraints are resolved here once; the returned
+        function only runs the checks this field actually declares.
         """
-        errors = []
         expected_type = field_config.get('type', 'string')
         python_type = self.get_python_type(expected_type)
-        
-        # Check if field is null and nullable
-        if field_value is None:
-            if not field_config.get('nullable', True):
-                errors.append(f"Field '{field_name}' is not nullable but value is null")
-            return errors
-        
-        # Type validation
-        if not isinstance(field_value, python_type):
-            actual_type = type(field_value).__name__
-            errors.append(f"Field '{field_name}' type mismatch: expected {expected_type}, got {actual_type}")
-            return errors
-        
-        # Constraint validation
+        nullable = field_config.get('nullable', True)
         constraints = field_config.get('constraints', {})
+        type_match_cache = self._type_match_cache
+        checks = []
         
         # String constraints
         if expected_type == 'string':
-            if 'min_length' in constraints and len(str(field_value)) < constraints['min_length']:
-                errors.append(f"Field '{field_name}' length {len(str(field_value))} below minimum {constraints['min_length']}")
+            if 'min_length' in constraints:
+                min_length = constraints['min_length']
+                checks.append(lambda v: f"Field '{field_name}' length {len(str(v))} below minimum {min_length}"
+                              if len(str(v)) < min_length else None)
             
-            if 'max_length' in constraints and len(str(field_value)) > constraints['max_length']:
-                errors.append(f"Field '{field_name}' length {len(str(field_value))} above maximum {constraints['max_length']}")
+            if 'max_length' in constraints:
+                max_length = constraints['max_length']
+                checks.append(lambda v: f"Field '{field_name}' length {len(str(v))} above maximum {max_length}"
+                              if len(str(v)) > max_length else None)
             
             if 'pattern' in constraints:
                 pattern = constraints['pattern']
-                if not re.match(pattern, str(field_value)):
-                    errors.append(f"Field '{field_name}' value '{field_value}' does not match pattern '{pattern}'")
+                match = re.compile(pattern).match
+                checks.append(lambda v: f"Field '{field_name}' value '{v}' does not match pattern '{pattern}'"
+                              if not match(str(v)) else None)
             
             if 'allowed_values' in constraints:
                 allowed = constraints['allowed_values']
-                if field_value not in allowed:
-                    errors.append(f"Field '{field_name}' value '{field_value}' not in allowed values: {allowed}")
+                checks.append(lambda v: f"Field '{field_name}' value '{v}' not in allowed values: {allowed}"
+                              if v not in allowed else None)
         
         # Numeric constraints
         elif expected_type in ['integer', 'float']:
-            if 'min_value' in constraints and float(field_value) < constraints['min_value']:
-                errors.append(f"Field '{field_name}' value {field_value} below minimum {constraints['min_value']}")
+            if 'min_value' in constraints:
+                min_value = constraints['min_value']
+                checks.append(lambda v: f"Field '{field_name}' value {v} below minimum {min_value}"
+                              if float(v) < min_value else None)
             
-            if 'max_value' in constraints and float(field_value) > constraints['max_value']:
-                errors.append(f"Field '{field_name}' value {field_value} above maximum {constraints['max_value']}")
+            if 'max_value' in constraints:
+                max_value = constraints['max_value']
+                checks.append(lambda v: f"Field '{field_name}' value {v} above maximum {max_value}"
+                              if float(v) > max_value else None)
             
             if 'precision' in constraints and expected_type == 'float':
                 precision = constraints['precision']
-                if len(str(field_value).split('.')[-1]) > precision:
-                    errors.append(f"Field '{field_name}' precision {len(str(field_value).split('.')[-1])} exceeds maximum {precision}")
+                checks.append(lambda v: f"Field '{field_name}' precision {len(str(v).split('.')[-1])} exceeds maximum {precision}"
+                              if len(str(v).split('.')[-1]) > precision else None)
+        
+        def validate(field_value: Any) -> List[str]:
+            # Check if field is null and nullable
+            if field_value is None:
+                return [] if nullable else [f"Field '{field_name}' is not nullable but value is null"]
+            
+            # Type validation (memoized per value type)
+            type_key = (python_type, type(field_value))
+            type_matches = type_match_cache.get(type_key)
+            if type_matches is None:
+                type_matches = type_match_cache[type_key] = isinstance(field_value, python_type)
+            
+            if not type_matches:
+                value_type = type(field_value)
+                actual_type = _PY2CONTRACT.get(value_type) or value_type.__name__
+                return [f"Field '{field_name}' type mismatch: expected {expected_type}, got {actual_type}"]
+            
+            # Constraint validation
+            errors = []
+            for check in checks:
+                error = check(field_value)
+                if error:
+                    errors.append(error)
+            return errors
         
-        return errors
+        return validate
     
-    def validate_record(self, record: Dict) -> Dict[str, Any]:
+    def get_python_type(self, contract_type: str) -> type:
+        """Convert contract type to Python type"""
+        type_mapping = {
+            'string': str,
+            'integer': int,
+            'float': float,
+            'boolean': bool,
+            'datetime': str,  # ISO string representation
+            'array': list,
+            'object': dict
+        }
+        return type_mapping.get(contract_type.lower(), str)
+    
+    def validate_field_type(self, field_name: str, field_value: Any, field_config: Dict) -> List[str]:
+        """
+        Validate field type and constraints
+        
+        Detection Logic: Strict type validation with constraint checking
+        Returns: List of validation error messages
+        """
+        field_check = self._field_checks.get(field_name)
+        if field_check is not None and field_check[0] is field_config:
+            return field_check[1](field_value)
+        
+        # Ad-hoc field config: specialize on the fly
+        return self._compile_field_validator(field_name, field_config)(field_value)
+    
+    def validate_record(self, record: Dict, *, stop_on_first: bool = False) -> Dict[str, Any]:
         """
         Validate a single record against the contract
         
-        Detection Logic: Comprehensive validation with detailed error reporting
+        Detection Logic: Comprehensive validation with detailed error reporting;
+        with stop_on_first=True returns as soon as one violation is found, for
+        callers that only need a valid/invalid answer
         Returns: Validation result with errors and violations
         """
         result = {
@@ -233,12 +307,8 @@ class ContractValidator:
             'violations': []
         }
         
-        required_fields = self.contract.get('required_fields', {})
-        optional_fields = self.contract.get('optional_fields', {})
-        all_fields = {**required_fields, **optional_fields}
-        
         # Check for missing required fields
-        for field_name, field_config in required_fields.items():
+        for field_name in self._required_fields:
             if field_name not in record:
                 error = f"Required field '{field_name}' is missing"
                 result['errors'].append(error)
@@ -248,12 +318,15 @@ class ContractValidator:
                     'description': error
                 })
                 result['valid'] = False
+                if stop_on_first:
+                    return result
         
         # Validate present fields
         for field_name, field_value in record.items():
-            if field_name in all_fields:
-                field_config = all_fields[field_name]
-                validation_errors = self.validate_field_type(field_name, field_value, field_config)
+            field_check = self._field_checks.get(field_name)
+            if field_check is not None:
+                field_config, validate_field = field_check
+                validation_errors = validate_field(field_value)
                 
                 if validation_errors:
                     result['errors'].extend(validation_errors)
@@ -268,15 +341,18 @@ class ContractValidator:
                     elif any('length' in error.lower() for error in validation_errors):
                         violation_type = 'CONSTRAINT_VIOLATION'
                     
+                    value_type = type(field_value)
                     result['violations'].append({
                         'type': violation_type,
                         'field_name': field_name,
                         'expected_type': field_config.get('type'),
-                        'actual_type': type(field_value).__name__,
+                        'actual_type': _PY2CONTRACT.get(value_type) or value_type.__name__,
                         'errors': validation_errors
                     })
+                    if stop_on_first:
+                        return result
             
-            elif self.contract.get('validation_rules', {}).get('schema_drift', {}).get('detect_new_fields', True):
+            elif self._detect_new_fields:
                 # Unexpected field detected
                 error = f"Unexpected field '{field_name}' not defined in contract"
                 result['errors'].append(error)
@@ -286,8 +362,28 @@ class ContractValidator:
                     'description': error
                 })
                 result['valid'] = False
+                if stop_on_first:
+                    return result
         
         return result
+    
+    def validate_batch(self, records: List[Dict], *,
+                       stop_on_first: bool = False) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Validate a batch of records against the contract in one call
+        
+        Detection Logic: Same checks as validate_record, run over the whole batch
+        Returns: (record_index, validation_result) pairs for invalid records only
+        """
+        validate_record = self.validate_record
+        invalid = []
+        
+        for i, record in enumerate(records):
+            result = validate_record(record, stop_on_first=stop_on_first)
+            if not result['valid']:
+                invalid.append((i, result))
+        
+        return invalid
 
 
 class ContractGuard:
@@ -306,6 +402,8 @@ class ContractGuard:
         self.cdc_db = None
         self.violation_banner = ContractViolationBanner()
         self.validator = ContractValidator(self.contract_config)
+        # log_directory -> (file signature, parsed records) for load_sample_json_logs
+        self._json_log_cache: Dict[str, Tuple[Tuple, List[Dict]]] = {}
         
     def _setup_logger(self) -> logging.Logger:
         """Setup structured logging for contract guard"""
@@ -333,13 +431,19 @@ class ContractGuard:
             self.logger.error(f"Failed to load configuration: {str(e)}")
             raise
     
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _parse_contract(contract_path: str, mtime_ns: int) -> Dict:
+        """Parse a contract YAML; cached per (path, mtime_ns) and shared read-only"""
+        with open(contract_path, 'r') as file:
+            return yaml.safe_load(file)
+    
     def _load_contract(self, contract_path: str) -> Dict:
-        """Load contract configuration"""
+        """Load contract configuration, re-parsing only when the file changes"""
         try:
-            with open(contract_path, 'r') as file:
-                contract = yaml.safe_load(file)
-                self.logger.info(f"Contract loaded from {contract_path}")
-                return contract
+            contract = self._parse_contract(contract_path, os.stat(contract_path).st_mtime_ns)
+            self.logger.info(f"Contract loaded from {contract_path}")
+            return contract
         except Exception as e:
             self.logger.error(f"Failed to load contract: {str(e)}")
             raise
@@ -443,7 +547,9 @@ class ContractGuard:
         """
         Load sample JSON logs from file system for validation
         
-        Detection Logic: Sample recent JSON log files
+        Detection Logic: Sample recent JSON (one document per file) and JSONL
+        (one record per line, streamed) log files. Parsed records are cached per
+        directory and reused until a sampled file's mtime or size changes
         Returns: List of parsed JSON records
         """
         try:
@@ -452,14 +558,34 @@ class ContractGuard:
                 self.logger.warning(f"Log directory {log_directory} does not exist")
                 return []
             
-            # Get recent JSON files
-            json_files = list(log_dir.glob("*.json"))[:sample_size]
+            # Get recent JSON and JSONL files
+            json_files = [*log_dir.glob("*.json"), *log_dir.glob("*.jsonl")][:sample_size]
+            
+            # Reuse the previous parse if none of the sampled files changed
+            signature = []
+            for json_file in json_files:
+                stat = json_file.stat()
+                signature.append((json_file.name, stat.st_mtime_ns, stat.st_size))
+            signature = tuple(signature)
+            
+            cached = self._json_log_cache.get(log_directory)
+            if cached is not None and cached[0] == signature:
+                self.logger.info("Reusing %d cached records from %d JSON files",
+                                 len(cached[1]), len(json_files))
+                return list(cached[1])
+            
             records = []
             
             for json_file in json_files:
                 try:
-                    with open(json_file, 'r') as f:
-                        data = json.load(f)
+                    # Read raw bytes; json.loads decodes UTF-8 itself, skipping
+                    # the text-mode decoding layer
+                    with open(json_file, 'rb') as f:
+                        if json_file.suffix == '.jsonl':
+                            records.extend(json.loads(line) for line in f if line.strip())
+                            continue
+                        
+                        data = json.loads(f.read())
                         if isinstance(data, list):
                             records.extend(data)
                         else:
@@ -468,7 +594,8 @@ class ContractGuard:
                     self.logger.warning(f"Failed to parse {json_file}: {str(e)}")
             
             self.logger.info(f"Loaded {len(records)} records from {len(json_files)} JSON files")
-            return records
+            self._json_log_cache[log_directory] = (signature, records)
+            return list(records)
             
         except Exception as e:
             self.logger.error(f"Failed to load sample JSON logs: {str(e)}")
@@ -514,56 +641,53 @@ class ContractGuard:
         Detection Logic: Comprehensive validation with violation tracking
         Returns: Validation summary with all violations
         """
+        invalid_results = self.validator.validate_batch(records)
+        
         summary = {
             'total_records': len(records),
-            'valid_records': 0,
-            'invalid_records': 0,
+            'valid_records': len(records) - len(invalid_results),
+            'invalid_records': len(invalid_results),
             'violations': [],
             'violation_counts': {}
         }
         
-        for i, record in enumerate(records):
-            validation_result = self.validator.validate_record(record)
-            
-            if validation_result['valid']:
-                summary['valid_records'] += 1
-            else:
-                summary['invalid_records'] += 1
+        # Process violations
+        for i, validation_result in invalid_results:
+            for violation in validation_result['violations']:
+                violation['record_index'] = i
+                summary['violations'].append(violation)
                 
-                # Process violations
-                for violation in validation_result['violations']:
-                    violation['record_index'] = i
-                    summary['violations'].append(violation)
-                    
-                    # Count violation types
-                    violation_type = violation['type']
-                    summary['violation_counts'][violation_type] = summary['violation_counts'].get(violation_type, 0) + 1
-                    
-                    # Log to database
-                    self.log_contract_violation(violation)
-                    
-                    # Print alert banner for critical violations
-                    if violation['type'] in ['TYPE_MISMATCH', 'MISSING_REQUIRED_FIELD']:
-                        alert_details = {
-                            'contract_name': self.contract_config.get('contract_name'),
-                            'violation_type': violation['type'],
-                            'field_name': violation.get('field_name'),
-                            'expected_type': violation.get('expected_type'),
-                            'actual_type': violation.get('actual_type'),
-                            'description': f"Contract violation: {violation['errors'][0] if violation['errors'] else 'Unknown error'}",
-                            'severity': 'CRITICAL',
-                            'validation_errors': violation['errors']
-                        }
-                        self.violation_banner.print_contract_violation(alert_details)
-        
+                # Count violation types
+                violation_type = violation['type']
+                summary['violation_counts'][violation_type] = summary['violation_counts'].get(violation_type, 0) + 1
+                
+                # Log to database
+                self.log_contract_violation(violation)
+                
+                # Print alert banner for critical violations
+                if violation['type'] in ['TYPE_MISMATCH', 'MISSING_REQUIRED_FIELD']:
+                    alert_details = {
+                        'contract_name': self.contract_config.get('contract_name'),
+                        'violation_type': violation['type'],
+                        'field_name': violation.get('field_name'),
+                        'expected_type': violation.get('expected_type'),
+                        'actual_type': violation.get('actual_type'),
+                        'description': f"Contract violation: {violation['errors'][0] if violation['errors'] else 'Unknown error'}",
+                        'severity': 'CRITICAL',
+                        'validation_errors': violation['errors']
+                    }
+                    self.violation_banner.print_contract_violation(alert_details)
+    
         return summary
     
     def run_contract_validation(self, use_database: bool = True, 
-                              use_json_logs: bool = False) -> Dict[str, Any]:
+                              use_json_logs: bool = False,
+                              json_log_directory: Optional[str] = None) -> Dict[str, Any]:
         """
         Main contract validation execution
         
-        Detection Logic: Orchestrates contract validation against sample data
+        Detection Logic: Orchestrates contract validation against sample data;
+        json_log_directory overrides the default JSON log location
         Returns: Comprehensive validation results
         """
         results = {
@@ -598,9 +722,11 @@ class ContractGuard:
                 records.extend(db_records)
             
             if use_json_logs:
-                json_records = self.load_sample_json_logs(
-                    sample_size=self.contract_config.get('sampling', {}).get('sample_size', 10)
-                )
+                json_sample_size = self.contract_config.get('sampling', {}).get('sample_size', 10)
+                if json_log_directory is not None:
+                    json_records = self.load_sample_json_logs(json_log_directory, json_sample_size)
+                else:
+                    json_records = self.load_sample_json_logs(sample_size=json_sample_size)
                 records.extend(json_records)
             
             if not records:
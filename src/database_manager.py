@@ -13,14 +13,25 @@ import threading
 import logging
 import psycopg2
 import psycopg2.pool
+import psycopg2.extras
 from psycopg2 import sql, OperationalError
 from typing import Dict, List, Tuple, Optional, Any
 from contextlib import contextmanager
 from queue import Queue, Empty
 import random
+import weakref
 
 from config_manager import get_config
 
+# Return NUMERIC columns (baselines, alert metrics) as float rather than Decimal;
+# every consumer does float arithmetic on them
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'DEC2FLOAT',
+    lambda value, cursor: float(value) if value is not None else None
+)
+psycopg2.extensions.register_type(DEC2FLOAT)
+
 
 class DatabaseConnectionManager:
     """
@@ -50,6 +61,9 @@ class DatabaseConnectionManager:
         self._connection_pool = None
         self._pool_lock = threading.Lock()
         
+        # Names of server-side prepared statements, tracked per pooled connection
+        self._prepared_statements = weakref.WeakKeyDictionary()
+        
         # Connection health tracking
         self._last_health_check = 0
         self._health_check_interval = 60  # seconds
@@ -116,6 +130,7 @@ class DatabaseConnectionManager:
                     user=self.db_config.user,
                     password=self.db_config.password,
                     connect_timeout=self.db_config.timeout,
+                    client_encoding='UTF8',
                     sslmode='require' if self.db_config.ssl_enabled else 'disable'
                 )
                 
@@ -210,6 +225,29 @@ class DatabaseConnectionManager:
                 except Exception as e:
                     self.logger.error(f"Error returning connection to pool: {str(e)}")
     
+    @contextmanager
+    def transaction(self):
+        """
+        Run several statements on one pooled connection as a single transaction
+        
+        Commits once when the block exits cleanly and rolls back on any error.
+        Not retried: the caller's block cannot be safely replayed.
+        
+        Yields:
+            Database cursor bound to the transaction
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+                self.logger.debug("Transaction committed successfully")
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
     def execute_query(self, query: str, params: Optional[Tuple] = None, 
                      fetch: bool = True) -> List[Tuple]:
         """
@@ -243,6 +281,55 @@ class DatabaseConnectionManager:
         
         return self._exponential_backoff_retry(_execute_query)
     
+    def execute_prepared(self, name: str, statement: str, params: Optional[Tuple] = None,
+                        fetch: bool = True) -> List[Tuple]:
+        """
+        Execute a server-side prepared statement with thread safety and retry logic
+        
+        The statement is PREPAREd the first time it is used on each pooled
+        connection and EXECUTEd thereafter, so Postgres skips parse/plan on
+        repeat calls.
+        
+        Args:
+            name: Prepared statement name
+            statement: SQL statement using $1, $2, ... positional parameters
+            params: Statement parameters
+            fetch: Whether to fetch results
+            
+        Returns:
+            Query results if fetch=True, otherwise None
+        """
+        placeholders = ", ".join(["%s"] * len(params)) if params else ""
+        execute_query = f"EXECUTE {name}({placeholders})" if params else f"EXECUTE {name}"
+        
+        def _execute_prepared():
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    with self._lock:
+                        prepared = self._prepared_statements.setdefault(conn, set())
+                    
+                    if name not in prepared:
+                        cursor.execute(f"PREPARE {name} AS {statement}")
+                        prepared.add(name)
+                        self.logger.debug(f"Prepared statement {name} on pooled connection")
+                    
+                    cursor.execute(execute_query, params)
+                    
+                    if fetch:
+                        results = cursor.fetchall()
+                        self.logger.debug(f"Prepared statement {name} returned {len(results)} rows")
+                        return results
+                    else:
+                        conn.commit()
+                        self.logger.debug(f"Prepared statement {name} executed successfully (no fetch)")
+                        return []
+                        
+                finally:
+                    cursor.close()
+        
+        return self._exponential_backoff_retry(_execute_prepared)
+    
     def execute_batch(self, query: str, params_list: List[Tuple]) -> None:
         """
         Execute batch query with thread safety and retry logic
@@ -264,6 +351,31 @@ class DatabaseConnectionManager:
         
         self._exponential_backoff_retry(_execute_batch)
     
+    def execute_values(self, query: str, params_list: List[Tuple], page_size: int = 100) -> None:
+        """
+        Execute multi-row INSERT with thread safety and retry logic
+        
+        Uses psycopg2.extras.execute_values so each page of rows is sent as a
+        single statement instead of one round trip per row.
+        
+        Args:
+            query: SQL query with a single "VALUES %s" placeholder
+            params_list: List of parameter tuples
+            page_size: Maximum number of rows per statement
+        """
+        def _execute_values():
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    psycopg2.extras.execute_values(cursor, query, params_list, page_size=page_size)
+                    conn.commit()
+                    self.logger.info(f"Multi-row query executed successfully, {len(params_list)} rows affected")
+                    
+                finally:
+                    cursor.close()
+        
+        self._exponential_backoff_retry(_execute_values)
+    
     def check_connection_health(self) -> bool:
         """
         Check database connection health
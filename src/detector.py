@@ -11,16 +11,40 @@ Reliability First: Comprehensive logging, error handling, and structured alertin
 """
 
 import yaml
+import io
+import json
 import logging
 import sys
+import threading
 import psycopg2
+import psycopg2.pool
 from psycopg2 import sql
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-import statistics
-import math
 import os
-from termcolor import colored, cprint
+from termcolor import colored
+
+
+# Connection pools shared by every DatabaseConnection in the process, keyed by DSN
+_POOLS: Dict[str, psycopg2.pool.ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(config: Dict) -> psycopg2.pool.ThreadedConnectionPool:
+    """Return the connection pool for a database config, creating it on first use"""
+    dsn = config['connection_string']
+    with _POOLS_LOCK:
+        pool = _POOLS.get(dsn)
+        if pool is None:
+            pool = psycopg2.pool.ThreadedConnectionPool(
+                minconn=1,
+                maxconn=4,
+                dsn=dsn,
+                connect_timeout=config.get('timeout', 30)
+            )
+            _POOLS[dsn] = pool
+        return pool
 
 
 class CriticalAlertBanner:
@@ -37,28 +61,36 @@ class CriticalAlertBanner:
         # Create the alert border
         border = "!" * 80
         
-        # Print the alert with colors for maximum visibility
-        print("\n" + "=" * 80)
-        cprint(border, 'red', attrs=['bold'])
-        cprint(f"🚨 {severity} DATA RELIABILITY ALERT 🚨", 'red', attrs=['bold', 'blink'])
-        cprint(border, 'red', attrs=['bold'])
-        cprint(f"ALERT TYPE: {alert_type}", 'yellow', attrs=['bold'])
-        cprint(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}", 'yellow')
-        cprint(f"DESCRIPTION: {description}", 'white', attrs=['bold'])
+        # Assemble the banner in memory so it reaches stdout in a single write
+        buf = io.StringIO()
+        buf.write("\n" + "=" * 80 + "\n")
+        buf.write(colored(border, 'red', attrs=['bold']) + "\n")
+        buf.write(colored(f"🚨 {severity} DATA RELIABILITY ALERT 🚨", 'red', attrs=['bold', 'blink']) + "\n")
+        buf.write(colored(border, 'red', attrs=['bold']) + "\n")
+        buf.write(colored(f"ALERT TYPE: {alert_type}", 'yellow', attrs=['bold']) + "\n")
+        buf.write(colored(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}", 'yellow') + "\n")
+        buf.write(colored(f"DESCRIPTION: {description}", 'white', attrs=['bold']) + "\n")
         
         if details:
-            cprint("ADDITIONAL DETAILS:", 'cyan')
+            buf.write(colored("ADDITIONAL DETAILS:", 'cyan') + "\n")
             for key, value in details.items():
-                cprint(f"  • {key}: {value}", 'cyan')
+                buf.write(colored(f"  • {key}: {value}", 'cyan') + "\n")
+        
+        buf.write(colored(border, 'red', attrs=['bold']) + "\n")
+        buf.write(colored("🔥 IMMEDIATE ACTION REQUIRED 🔥", 'red', attrs=['bold', 'blink']) + "\n")
+        buf.write(colored(border, 'red', attrs=['bold']) + "\n")
+        buf.write("=" * 80 + "\n\n")
         
-        cprint(border, 'red', attrs=['bold'])
-        cprint("🔥 IMMEDIATE ACTION REQUIRED 🔥", 'red', attrs=['bold', 'blink'])
-        cprint(border, 'red', attrs=['bold'])
-        print("=" * 80 + "\n")
+        sys.stdout.write(buf.getvalue())
+        if sys.stdout.isatty():
+            sys.stdout.flush()
         
-        # Also print to stderr for log capture
-        error_msg = f"CRITICAL ALERT: {alert_type} - {description}"
-        print(error_msg, file=sys.stderr)
+        # Also emit one structured line to stderr for log capture
+        sys.stderr.write(json.dumps({
+            "alert": alert_type,
+            "desc": description,
+            "sev": severity
+        }) + "\n")
 
 
 class DatabaseConnection:
@@ -85,16 +117,13 @@ class DatabaseConnection:
         return logger
     
     def connect(self) -> bool:
-        """Establish database connection with error handling"""
+        """Check out a pooled database connection with error handling"""
         try:
-            self.connection = psycopg2.connect(
-                self.config['connection_string'],
-                connect_timeout=self.config.get('timeout', 30)
-            )
-            self.logger.info(f"Successfully connected to {self.config['name']}")
+            self.connection = _get_pool(self.config).getconn()
+            self.logger.info("Successfully connected to %s", self.config['name'])
             return True
         except Exception as e:
-            self.logger.error(f"Failed to connect to {self.config['name']}: {str(e)}")
+            self.logger.error("Failed to connect to %s: %s", self.config['name'], e)
             return False
     
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Tuple]:
@@ -109,18 +138,19 @@ class DatabaseConnection:
             results = cursor.fetchall()
             cursor.close()
             
-            self.logger.info(f"Query executed successfully on {self.config['name']}, returned {len(results)} rows")
+            self.logger.info("Query executed successfully on %s, returned %s rows", self.config['name'], len(results))
             return results
             
         except Exception as e:
-            self.logger.error(f"Query failed on {self.config['name']}: {str(e)}")
+            self.logger.error("Query failed on %s: %s", self.config['name'], e)
             raise
     
     def close(self):
-        """Close database connection"""
+        """Return database connection to the shared pool"""
         if self.connection:
-            self.connection.close()
-            self.logger.info(f"Connection closed to {self.config['name']}")
+            _get_pool(self.config).putconn(self.connection)
+            self.connection = None
+            self.logger.info("Connection released to pool for %s", self.config['name'])
 
 
 class DetectionEngine:
@@ -157,10 +187,10 @@ class DetectionEngine:
         try:
             with open(config_path, 'r') as file:
                 config = yaml.safe_load(file)
-                self.logger.info(f"Configuration loaded from {config_path}")
+                self.logger.info("Configuration loaded from %s", config_path)
                 return config
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {str(e)}")
+            self.logger.error("Failed to load configuration: %s", e)
             raise
     
     def initialize_connection(self) -> bool:
@@ -177,11 +207,18 @@ class DetectionEngine:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Connection initialization failed: {str(e)}")
+            self.logger.error("Connection initialization failed: %s", e)
             return False
     
     def create_alerts_table(self) -> bool:
-        """Create monitoring.alerts table if it doesn't exist"""
+        """
+        Create monitoring.alerts table if it doesn't exist
+        
+        Runs on every detection cycle, so it only issues the non-locking
+        CREATE TABLE IF NOT EXISTS and commits it straight away. The one-time
+        migration (SET LOGGED, the idx_alerts_dedup partial unique index and the
+        BRIN index on alert_timestamp) lives in scripts/setup_monitoring.py.
+        """
         create_table_query = """
         CREATE TABLE IF NOT EXISTS monitoring.alerts (
             id SERIAL PRIMARY KEY,
@@ -189,15 +226,14 @@ class DetectionEngine:
             alert_severity VARCHAR(20) NOT NULL DEFAULT 'CRITICAL',
             description TEXT NOT NULL,
             source_table VARCHAR(100),
-            metric_value DECIMAL(15,4),
-            threshold_value DECIMAL(15,4),
-            z_score DECIMAL(10,4),
+            metric_value DOUBLE PRECISION,
+            threshold_value DOUBLE PRECISION,
+            z_score DOUBLE PRECISION,
             details JSONB,
             alert_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             resolved BOOLEAN DEFAULT FALSE,
-            resolved_timestamp TIMESTAMP,
-            UNIQUE(alert_type, source_table, alert_timestamp)
-        )
+            resolved_timestamp TIMESTAMP
+        );
         """
         
         try:
@@ -208,11 +244,12 @@ class DetectionEngine:
             cursor = self.cdc_db.connection.cursor()
             cursor.execute(create_table_query)
             cursor.close()
+            self.cdc_db.connection.commit()
             
             self.logger.info("Alerts table created/verified successfully")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to create alerts table: {str(e)}")
+            self.logger.error("Failed to create alerts table: %s", e)
             return False
     
     def get_baseline_metrics(self, metric_name: str, source_table: str) -> Optional[Tuple[float, float, int]]:
@@ -234,13 +271,13 @@ class DetectionEngine:
             results = self.cdc_db.execute_query(query, (metric_name, source_table))
             if results:
                 mean, std_dev, sample_size = results[0]
-                self.logger.info(f"Retrieved baseline for {metric_name}: mean={mean}, std_dev={std_dev}")
+                self.logger.info("Retrieved baseline for %s: mean=%s, std_dev=%s", metric_name, mean, std_dev)
                 return float(mean), float(std_dev), int(sample_size)
             else:
-                self.logger.warning(f"No baseline found for {metric_name} on {source_table}")
+                self.logger.warning("No baseline found for %s on %s", metric_name, source_table)
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to retrieve baseline metrics: {str(e)}")
+            self.logger.error("Failed to retrieve baseline metrics: %s", e)
             return None
     
     def get_current_volume_metrics(self) -> Optional[Tuple[int, datetime]]:
@@ -266,13 +303,13 @@ class DetectionEngine:
             results = self.cdc_db.execute_query(query)
             if results and results[0][0] > 0:
                 current_count, latest_timestamp = results[0]
-                self.logger.info(f"Current volume metrics: {current_count} records, latest: {latest_timestamp}")
+                self.logger.info("Current volume metrics: %s records, latest: %s", current_count, latest_timestamp)
                 return int(current_count), latest_timestamp
             else:
                 self.logger.warning("No current volume data found")
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to get current volume metrics: {str(e)}")
+            self.logger.error("Failed to get current volume metrics: %s", e)
             return None
     
     def calculate_z_score(self, current_value: float, mean: float, std_dev: float) -> float:
@@ -286,43 +323,9 @@ class DetectionEngine:
             return 0.0
         
         z_score = abs((current_value - mean) / std_dev)
-        self.logger.info(f"Z-Score calculation: current={current_value}, mean={mean}, std_dev={std_dev}, z_score={z_score}")
+        self.logger.info("Z-Score calculation: current=%s, mean=%s, std_dev=%s, z_score=%s", current_value, mean, std_dev, z_score)
         return z_score
     
-    def log_alert(self, alert_type: str, description: str, source_table: Optional[str] = None,
-                 metric_value: Optional[float] = None, threshold_value: Optional[float] = None,
-                 z_score: Optional[float] = None, details: Optional[Dict] = None) -> bool:
-        """
-        Log alert to monitoring.alerts table
-        
-        Idempotency: UNIQUE constraint prevents duplicate alerts
-        """
-        insert_query = """
-        INSERT INTO monitoring.alerts 
-        (alert_type, alert_severity, description, source_table, metric_value, threshold_value, z_score, details)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        try:
-            import json
-            details_json = json.dumps(details) if details else None
-            
-            if not self.cdc_db.connection:
-                if not self.cdc_db.connect():
-                    raise ConnectionError("Cannot connect to database")
-            
-            cursor = self.cdc_db.connection.cursor()
-            cursor.execute(insert_query, 
-                             (alert_type, "CRITICAL", description, source_table,
-                              metric_value, threshold_value, z_score, details_json))
-            cursor.close()
-            
-            self.logger.info(f"Alert logged to database: {alert_type}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to log alert: {str(e)}")
-            return False
-    
     def check_volume_anomaly(self) -> bool:
         """
         Volume Check: Compare current ingestion counts to baselines
@@ -381,39 +384,41 @@ class DetectionEngine:
                     details=alert_details
                 )
                 
-                self.logger.error(f"Volume anomaly detected: Z-Score {z_score:.2f} > 3.0")
+                self.logger.error("Volume anomaly detected: Z-Score %.2f > 3.0", z_score)
                 return True
             else:
-                self.logger.info(f"Volume check passed: Z-Score {z_score:.2f} <= 3.0")
+                self.logger.info("Volume check passed: Z-Score %.2f <= 3.0", z_score)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Volume anomaly detection failed: {str(e)}")
+            self.logger.error("Volume anomaly detection failed: %s", e)
             return False
     
-    def get_freshness_metrics(self) -> Optional[datetime]:
+    def get_freshness_metrics(self) -> Optional[Tuple[datetime, datetime]]:
         """
         Get freshness metrics for staleness detection
         
-        Detection Logic: Get max cdc_timestamp from dim_orders_history
-        Returns: Latest timestamp or None if no data
+        Detection Logic: Get max cdc_timestamp from dim_orders_history together with
+        the database's LOCALTIMESTAMP, so staleness is measured on the same clock
+        (and in the same session time zone) that stamped the rows
+        Returns: (latest timestamp, database now) or None if no data
         """
         query = """
-        SELECT MAX(cdc_timestamp) as latest_cdc_timestamp
+        SELECT MAX(cdc_timestamp) as latest_cdc_timestamp, LOCALTIMESTAMP as db_now
         FROM dim_orders_history
         """
         
         try:
             results = self.cdc_db.execute_query(query)
             if results and results[0][0]:
-                latest_timestamp = results[0][0]
-                self.logger.info(f"Latest CDC timestamp: {latest_timestamp}")
-                return latest_timestamp
+                latest_timestamp, db_now = results[0]
+                self.logger.info("Latest CDC timestamp: %s", latest_timestamp)
+                return latest_timestamp, db_now
             else:
                 self.logger.warning("No CDC timestamps found")
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to get freshness metrics: {str(e)}")
+            self.logger.error("Failed to get freshness metrics: %s", e)
             return None
     
     def check_freshness_anomaly(self) -> bool:
@@ -426,20 +431,22 @@ class DetectionEngine:
         try:
             self.logger.info("Starting freshness anomaly detection")
             
-            # Get latest CDC timestamp
-            latest_timestamp = self.get_freshness_metrics()
-            if not latest_timestamp:
+            # Get latest CDC timestamp and the database clock
+            freshness = self.get_freshness_metrics()
+            if not freshness:
                 self.logger.warning("Cannot perform freshness check: no timestamp data")
                 return False
             
-            # Calculate time since last record
-            now = datetime.now(timezone.utc)
+            # Calculate time since last record on the database clock; client
+            # clock skew does not enter the measurement
+            latest_timestamp, now = freshness
+            time_since_last = now - latest_timestamp
             
-            # Ensure latest_timestamp has timezone info
+            # Ensure timestamps have timezone info for reporting
             if latest_timestamp.tzinfo is None:
                 latest_timestamp = latest_timestamp.replace(tzinfo=timezone.utc)
+                now = now.replace(tzinfo=timezone.utc)
             
-            time_since_last = now - latest_timestamp
             minutes_since_last = time_since_last.total_seconds() / 60
             
             # Check threshold (30 minutes)
@@ -468,14 +475,14 @@ class DetectionEngine:
                     details=alert_details
                 )
                 
-                self.logger.error(f"Freshness anomaly detected: {minutes_since_last:.1f} minutes > 30 minutes")
+                self.logger.error("Freshness anomaly detected: %.1f minutes > 30 minutes", minutes_since_last)
                 return True
             else:
-                self.logger.info(f"Freshness check passed: {minutes_since_last:.1f} minutes <= 30 minutes")
+                self.logger.info("Freshness check passed: %.1f minutes <= 30 minutes", minutes_since_last)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Freshness anomaly detection failed: {str(e)}")
+            self.logger.error("Freshness anomaly detection failed: %s", e)
             return False
     
     def log_alert(self, alert_type: str, description: str, source_table: Optional[str] = None,
@@ -484,26 +491,26 @@ class DetectionEngine:
         """
         Log alert to monitoring.alerts table
         
-        Idempotency: UNIQUE constraint prevents duplicate alerts
+        Idempotency: Alerts already raised this minute are skipped via ON CONFLICT
+        against the idx_alerts_dedup partial unique index
         """
         insert_query = """
         INSERT INTO monitoring.alerts 
         (alert_type, alert_severity, description, source_table, metric_value, threshold_value, z_score, details)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (alert_type, source_table, alert_timestamp) DO NOTHING
+        ON CONFLICT DO NOTHING
         """
         
         try:
-            import json
             details_json = json.dumps(details) if details else None
             
             self.cdc_db.execute_query(insert_query, 
                                      (alert_type, "CRITICAL", description, source_table,
                                       metric_value, threshold_value, z_score, details_json))
-            self.logger.info(f"Alert logged to database: {alert_type}")
+            self.logger.info("Alert logged to database: %s", alert_type)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to log alert: {str(e)}")
+            self.logger.error("Failed to log alert: %s", e)
             return False
     
     def run_detection(self) -> Dict[str, bool]:
@@ -546,28 +553,28 @@ class DetectionEngine:
             if results["total_anomalies"] == 0:
                 self.logger.info("Detection completed: No anomalies detected")
             else:
-                self.logger.error(f"Detection completed: {results['total_anomalies']} anomalies detected")
+                self.logger.error("Detection completed: %s anomalies detected", results['total_anomalies'])
             
             return results
             
         except Exception as e:
-            self.logger.error(f"Detection execution failed: {str(e)}")
+            self.logger.error("Detection execution failed: %s", e)
             return results
         finally:
             # Cleanup connection
             if self.cdc_db:
                 self.cdc_db.close()
     
-    def generate_detection_summary(self, results: Dict[str, bool]) -> str:
-        """Generate detection summary report"""
-        summary = f"""
-# Detection Engine Summary
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
-
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _render_summary_body(volume_anomaly: bool, freshness_anomaly: bool,
+                             total_anomalies: int) -> str:
+        """Render the timestamp-independent part of the detection summary"""
+        return f"""
 ## Detection Results
-- **Volume Anomaly**: {'🚨 DETECTED' if results['volume_anomaly'] else '✅ Normal'}
-- **Freshness Anomaly**: {'🚨 DETECTED' if results['freshness_anomaly'] else '✅ Normal'}
-- **Total Anomalies**: {results['total_anomalies']}
+- **Volume Anomaly**: {'🚨 DETECTED' if volume_anomaly else '✅ Normal'}
+- **Freshness Anomaly**: {'🚨 DETECTED' if freshness_anomaly else '✅ Normal'}
+- **Total Anomalies**: {total_anomalies}
 
 ## Detection Logic Applied
 - **Volume Anomalies**: Z-Score > 3.0 threshold
@@ -575,9 +582,23 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
 - **Alert Idempotency**: Unique alerts in monitoring.alerts table
 
 ## Next Steps
-{'⚠️  IMMEDIATE ACTION REQUIRED' if results['total_anomalies'] > 0 else '✅ All systems normal'}
+{'⚠️  IMMEDIATE ACTION REQUIRED' if total_anomalies > 0 else '✅ All systems normal'}
 """
-        return summary
+    
+    def generate_detection_summary(self, results: Dict[str, bool]) -> str:
+        """
+        Generate detection summary report
+        
+        The report body only depends on the detection results, so it is cached
+        and the generation timestamp is prepended on every call.
+        """
+        body = self._render_summary_body(results['volume_anomaly'],
+                                         results['freshness_anomaly'],
+                                         results['total_anomalies'])
+        return f"""
+# Detection Engine Summary
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+{body}"""
 
 
 def main():
@@ -11,12 +11,13 @@ Usage:
 Flow:
 1. Run profiler to establish baselines
 2. Run detection engine to check for anomalies
-3. Run contract guard to prevent schema drift
+3. Run contract guard to prevent schema drift (concurrently with step 2)
 4. Generate comprehensive health report
 """
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
@@ -43,18 +44,23 @@ def main():
     
     print("✅ Profiler completed successfully")
     
-    # Step 2: Run detection engine
+    # Step 2 & 3: Run detection engine and contract guard concurrently.
+    # Only detection depends on the profiler baselines; each component opens
+    # its own database connection, so the two stages can overlap safely.
     print("\n🚨 Step 2: Running Detection Engine...")
-    detector = DetectionEngine()
-    detection_results = detector.run_detection()
-    
-    # Step 3: Run contract guard for schema drift prevention
     print("\n📋 Step 3: Running Contract Guard...")
+    detector = DetectionEngine()
     guard = ContractGuard()
-    contract_results = guard.run_contract_validation(
-        use_database=True,
-        use_json_logs=True
-    )
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        detection_future = executor.submit(detector.run_detection)
+        contract_future = executor.submit(
+            guard.run_contract_validation,
+            use_database=True,
+            use_json_logs=True
+        )
+        detection_results = detection_future.result()
+        contract_results = contract_future.result()
     
     # Step 4: Generate comprehensive report
     print("\n📋 Step 4: Generating Comprehensive Report...")
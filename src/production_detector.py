@@ -17,11 +17,66 @@ import math
 import threading
 import json
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Tuple, Optional
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Any
 
 from config_manager import get_config
 from database_manager import get_database_manager
-from termcolor import colored, cprint
+from termcolor import colored
+
+# Compact, reusable encoder for alert details (JSONB); default=str covers datetimes
+_DETAILS_ENCODER = json.JSONEncoder(separators=(',', ':'), default=str)
+
+# Keeps banners from concurrent detection threads from interleaving
+_BANNER_LOCK = threading.Lock()
+
+# Detector logger is configured once per process, however many engines are built
+_LOGGER_CONFIGURED = False
+_LOGGER_LOCK = threading.Lock()
+
+
+def _configure_logger_once(logging_config) -> logging.Logger:
+    """Attach console/rotating-file handlers to the detector logger on first use"""
+    global _LOGGER_CONFIGURED
+    
+    logger = logging.getLogger("production_detector")
+    if _LOGGER_CONFIGURED:
+        return logger
+    
+    with _LOGGER_LOCK:
+        if _LOGGER_CONFIGURED:
+            return logger
+        
+        logger.setLevel(getattr(logging_config, 'level', 'INFO'))
+        
+        if not logger.handlers:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - [%(threadName)s] - %(message)s'
+            )
+            
+            # Console handler
+            if logging_config.enable_console:
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(formatter)
+                logger.addHandler(console_handler)
+            
+            # File handler with rotation
+            if logging_config.enable_file:
+                log_dir = Path(logging_config.log_dir)
+                log_dir.mkdir(parents=True, exist_ok=True)
+                
+                file_handler = RotatingFileHandler(
+                    filename=log_dir / "detector.log",
+                    maxBytes=logging_config.max_bytes,
+                    backupCount=logging_config.backup_count
+                )
+                file_handler.setFormatter(formatter)
+                logger.addHandler(file_handler)
+        
+        _LOGGER_CONFIGURED = True
+    
+    return logger
 
 
 class ProductionCriticalAlertBanner:
@@ -48,37 +103,51 @@ class ProductionCriticalAlertBanner:
     
     @staticmethod
     def print_critical_alert(alert_type: str, description: str, severity: str = "CRITICAL", 
-                          details: Optional[Dict] = None):
+                          details: Optional[Dict] = None, timestamp: Optional[datetime] = None):
         """
         Print a high-visibility critical alert banner to console
         
         Idempotency: Unique alert content prevents alert fatigue
+        
+        Args:
+            timestamp: Detection cycle timestamp; defaults to the current UTC time
         """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        
         # Create the alert border
         border = "!" * 80
-        
-        # Print the alert with colors for maximum visibility
-        print("\n" + "=" * 80)
-        cprint(border, 'red', attrs=['bold'])
-        cprint(f"🚨 {severity} DATA RELIABILITY ALERT 🚨", 'red', attrs=['bold', 'blink'])
-        cprint(border, 'red', attrs=['bold'])
-        cprint(f"ALERT TYPE: {alert_type}", 'yellow', attrs=['bold'])
-        cprint(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}", 'yellow')
-        cprint(f"DESCRIPTION: {description}", 'white', attrs=['bold'])
+        border_line = colored(border, 'red', attrs=['bold'])
+        
+        # Assemble the banner up front so it reaches stdout in a single write
+        lines = [
+            "\n" + "=" * 80,
+            border_line,
+            colored(f"🚨 {severity} DATA RELIABILITY ALERT 🚨", 'red', attrs=['bold', 'blink']),
+            border_line,
+            colored(f"ALERT TYPE: {alert_type}", 'yellow', attrs=['bold']),
+            colored(f"TIMESTAMP: {timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}", 'yellow'),
+            colored(f"DESCRIPTION: {description}", 'white', attrs=['bold']),
+        ]
         
         if details:
-            cprint("ADDITIONAL DETAILS:", 'cyan')
-            for key, value in details.items():
-                cprint(f"  • {key}: {value}", 'cyan')
+            lines.append(colored("ADDITIONAL DETAILS:", 'cyan'))
+            lines.extend(colored(f"  • {key}: {value}", 'cyan') for key, value in details.items())
         
-        cprint(border, 'red', attrs=['bold'])
-        cprint("🔥 IMMEDIATE ACTION REQUIRED 🔥", 'red', attrs=['bold', 'blink'])
-        cprint(border, 'red', attrs=['bold'])
-        print("=" * 80 + "\n")
+        lines.extend([
+            border_line,
+            colored("🔥 IMMEDIATE ACTION REQUIRED 🔥", 'red', attrs=['bold', 'blink']),
+            border_line,
+            "=" * 80 + "\n"
+        ])
         
         # Also print to stderr for log capture
-        error_msg = f"CRITICAL ALERT: {alert_type} - {description}"
-        print(error_msg, file=sys.stderr)
+        error_msg = f"CRITICAL ALERT: {alert_type} - {description}\n"
+        
+        with _BANNER_LOCK:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            sys.stderr.write(error_msg)
 
 
 class ProductionDetectionEngine:
@@ -93,6 +162,9 @@ class ProductionDetectionEngine:
     - Comprehensive error handling
     """
     
+    # Set once monitoring.alerts has been created/verified in this process
+    _alerts_table_ready: bool = False
+    
     def __init__(self):
         """Initialize production detection engine"""
         self.config = get_config()
@@ -102,6 +174,9 @@ class ProductionDetectionEngine:
         # Thread safety
         self._lock = threading.RLock()
         
+        # Alerts queued during a detection cycle, written by flush_alerts()
+        self._pending_alerts: List[Tuple] = []
+        
         # Get database connection managers
         self.cdc_db = self.db_manager.get_connection_manager('cdc')
         
@@ -112,44 +187,17 @@ class ProductionDetectionEngine:
     
     def _setup_logger(self) -> logging.Logger:
         """Setup structured logger with rotation"""
-        logger = logging.getLogger("production_detector")
-        logger.setLevel(getattr(self.config.logging, 'level', 'INFO'))
-        
-        if not logger.handlers:
-            # Console handler
-            if self.config.logging.enable_console:
-                console_handler = logging.StreamHandler()
-                console_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - [%(threadName)s] - %(message)s'
-                )
-                console_handler.setFormatter(console_formatter)
-                logger.addHandler(console_handler)
-            
-            # File handler with rotation
-            if self.config.logging.enable_file:
-                from logging.handlers import RotatingFileHandler
-                
-                log_dir = self.config.logging.log_dir
-                import os
-                os.makedirs(log_dir, exist_ok=True)
-                
-                file_handler = RotatingFileHandler(
-                    filename=log_dir / "detector.log",
-                    maxBytes=self.config.logging.max_bytes,
-                    backupCount=self.config.logging.backup_count
-                )
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - [%(threadName)s] - %(message)s'
-                )
-                file_handler.setFormatter(file_formatter)
-                logger.addHandler(file_handler)
-        
-        return logger
+        return _configure_logger_once(self.config.logging)
     
     def create_alerts_table(self) -> bool:
         """
         Create monitoring.alerts table if it doesn't exist
         
+        Locking: Runs at process start, so only the non-locking CREATE TABLE IF NOT
+        EXISTS is issued here. The one-time migration (SET LOGGED, the idx_alerts_dedup
+        partial unique index and the BRIN index) lives in scripts/setup_monitoring.py
+        Compatibility: Same DDL as DetectionEngine.create_alerts_table in detector.py
+        
         Thread Safety: Uses thread-safe database manager
         """
         create_table_query = """
@@ -159,15 +207,14 @@ class ProductionDetectionEngine:
             alert_severity VARCHAR(20) NOT NULL DEFAULT 'CRITICAL',
             description TEXT NOT NULL,
             source_table VARCHAR(100),
-            metric_value DECIMAL(15,4),
-            threshold_value DECIMAL(15,4),
-            z_score DECIMAL(10,4),
+            metric_value DOUBLE PRECISION,
+            threshold_value DOUBLE PRECISION,
+            z_score DOUBLE PRECISION,
             details JSONB,
             alert_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             resolved BOOLEAN DEFAULT FALSE,
-            resolved_timestamp TIMESTAMP,
-            UNIQUE(alert_type, source_table, alert_timestamp)
-        )
+            resolved_timestamp TIMESTAMP
+        );
         """
         
         try:
@@ -176,122 +223,114 @@ class ProductionDetectionEngine:
                 self.logger.info("Alerts table created/verified successfully")
                 return True
         except Exception as e:
-            self.logger.error(f"Failed to create alerts table: {str(e)}")
+            self.logger.error("Failed to create alerts table: %s", e)
             return False
     
-    def get_baseline_metrics(self, metric_name: str, source_table: str) -> Optional[Tuple[float, float, int]]:
+    def get_detection_metrics(self) -> Optional[Dict[str, Any]]:
         """
-        Retrieve baseline metrics for Z-Score calculation
+        Get all metrics needed for one detection cycle in a single round trip
         
-        Detection Logic: Fetch mean, std_dev, and sample_size from monitoring.baselines
-        Returns: Tuple of (mean, std_dev, sample_size) or None if not found
+        Detection Logic: Joins the last hour's record count from dim_orders_history with
+        the latest hourly_ingestion_rate baseline, computes the Z-Score server-side and
+        fetches the latest CDC timestamp for the freshness check. The baseline is read
+        fresh every cycle, so a profiler upsert is picked up by the next detection run
+        Returns: Dictionary of volume, baseline and freshness metrics, or None on failure.
+                 Baseline fields are None when no baseline exists.
         
         Thread Safety: Uses thread-safe database manager
         """
         query = """
-        SELECT mean_value, std_deviation, sample_size
-        FROM monitoring.baselines
-        WHERE metric_name = %s AND table_name = %s
-        ORDER BY calculation_timestamp DESC
-        LIMIT 1
-        """
-        
-        try:
-            with self._lock:
-                results = self.cdc_db.execute_query(query, (metric_name, source_table))
-                if results:
-                    mean, std_dev, sample_size = results[0]
-                    self.logger.info(f"Retrieved baseline for {metric_name}: mean={mean}, std_dev={std_dev}")
-                    return float(mean), float(std_dev), int(sample_size)
-                else:
-                    self.logger.warning(f"No baseline found for {metric_name} on {source_table}")
-                    return None
-        except Exception as e:
-            self.logger.error(f"Failed to retrieve baseline metrics: {str(e)}")
-            return None
-    
-    def get_current_volume_metrics(self) -> Optional[Tuple[int, datetime]]:
-        """
-        Get current volume metrics for anomaly detection
-        
-        Detection Logic: Count records from last hour in dim_orders_history
-        Returns: Tuple of (current_count, latest_timestamp) or None
-        
-        Thread Safety: Uses thread-safe database manager
-        """
-        query = """
-        WITH current_metrics AS (
+        WITH cur AS (
             SELECT 
                 COUNT(*) as current_count,
                 MAX(created_at) as latest_timestamp
             FROM dim_orders_history
             WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+        ),
+        base AS (
+            SELECT mean_value, std_deviation, sample_size
+            FROM monitoring.baselines
+            WHERE metric_name = 'hourly_ingestion_rate' AND table_name = 'dim_orders_history'
+            ORDER BY calculation_timestamp DESC
+            LIMIT 1
+        ),
+        fresh AS (
+            SELECT MAX(cdc_timestamp) as latest_cdc_timestamp
+            FROM dim_orders_history
         )
-        SELECT current_count, latest_timestamp
-        FROM current_metrics
+        SELECT 
+            cur.current_count,
+            cur.latest_timestamp,
+            base.mean_value,
+            base.std_deviation,
+            base.sample_size,
+            CASE WHEN base.std_deviation = 0 THEN 0
+                 ELSE ABS((cur.current_count - base.mean_value) / base.std_deviation)
+            END as z_score,
+            fresh.latest_cdc_timestamp
+        FROM cur
+        CROSS JOIN fresh
+        LEFT JOIN base ON TRUE
         """
         
         try:
-            with self._lock:
-                results = self.cdc_db.execute_query(query)
-                if results and results[0][0] > 0:
-                    current_count, latest_timestamp = results[0]
-                    self.logger.info(f"Current volume metrics: {current_count} records, latest: {latest_timestamp}")
-                    return int(current_count), latest_timestamp
-                else:
-                    self.logger.warning("No current volume data found")
-                    return None
+            results = self.cdc_db.execute_prepared("detector_get_metrics", query)
+            (current_count, latest_timestamp, mean, std_dev, sample_size,
+             z_score, latest_cdc_timestamp) = results[0]
+            
+            has_baseline = mean is not None
+            metrics = {
+                "current_count": int(current_count),
+                "latest_timestamp": latest_timestamp,
+                "mean": float(mean) if has_baseline else None,
+                "std_dev": float(std_dev) if has_baseline else None,
+                "sample_size": int(sample_size) if has_baseline else None,
+                "z_score": float(z_score) if has_baseline else None,
+                "latest_cdc_timestamp": latest_cdc_timestamp
+            }
+            
+            self.logger.info("Detection metrics: current=%s, mean=%s, std_dev=%s, z_score=%s, "
+                             "latest_cdc_timestamp=%s", metrics['current_count'], metrics['mean'],
+                             metrics['std_dev'], metrics['z_score'], latest_cdc_timestamp)
+            return metrics
         except Exception as e:
-            self.logger.error(f"Failed to get current volume metrics: {str(e)}")
+            self.logger.error("Failed to get detection metrics: %s", e)
             return None
     
-    def calculate_z_score(self, current_value: float, mean: float, std_dev: float) -> float:
-        """
-        Calculate Z-Score for volume anomaly detection
-        
-        Detection Logic: Standard Z-Score calculation for statistical anomaly detection
-        Returns: Z-Score value (higher = more anomalous)
-        
-        Thread Safety: Thread-safe calculation
-        """
-        with self._lock:
-            if std_dev == 0:
-                return 0.0
-            
-            z_score = abs((current_value - mean) / std_dev)
-            self.logger.info(f"Z-Score calculation: current={current_value}, mean={mean}, std_dev={std_dev}, z_score={z_score}")
-            return z_score
-    
-    def check_volume_anomaly(self) -> bool:
+    def check_volume_anomaly(self, metrics: Optional[Dict[str, Any]] = None,
+                             now: Optional[datetime] = None) -> bool:
         """
         Volume Check: Compare current ingestion counts to baselines
         
         Detection Logic: Z-Score > 3.0 indicates significant volume anomaly
         Alerting: Logs VOLUME_ANOMALY to monitoring.alerts table
         
+        Args:
+            metrics: Cycle metrics from get_detection_metrics(); fetched if not provided
+            now: Detection cycle timestamp (UTC); defaults to the current time
+        
         Thread Safety: Thread-safe anomaly detection
         """
         try:
             self.logger.info("Starting volume anomaly detection")
             
-            # Get baseline metrics
-            baseline = self.get_baseline_metrics("hourly_ingestion_rate", "dim_orders_history")
-            if not baseline:
+            if metrics is None:
+                metrics = self.get_detection_metrics()
+            
+            if not metrics or metrics["mean"] is None:
                 self.logger.warning("Cannot perform volume check: no baseline available")
                 return False
             
-            mean, std_dev, sample_size = baseline
-            
-            # Get current metrics
-            current_metrics = self.get_current_volume_metrics()
-            if not current_metrics:
+            if metrics["current_count"] == 0:
                 self.logger.warning("Cannot perform volume check: no current data")
                 return False
             
-            current_count, latest_timestamp = current_metrics
-            
-            # Calculate Z-Score
-            z_score = self.calculate_z_score(current_count, mean, std_dev)
+            current_count = metrics["current_count"]
+            latest_timestamp = metrics["latest_timestamp"]
+            mean = metrics["mean"]
+            std_dev = metrics["std_dev"]
+            sample_size = metrics["sample_size"]
+            z_score = metrics["z_score"]
             
             # Check threshold
             threshold = self.config.monitoring.volume_anomaly_threshold
@@ -320,17 +359,18 @@ class ProductionDetectionEngine:
                 self.alert_banner.print_critical_alert(
                     alert_type="VOLUME_ANOMALY",
                     description=f"Ingestion volume anomaly detected! Current: {current_count} records, Expected: ~{mean:.0f} ± {std_dev:.0f}",
-                    details=alert_details
+                    details=alert_details,
+                    timestamp=now
                 )
                 
-                self.logger.error(f"Volume anomaly detected: Z-Score {z_score:.2f} > {threshold}")
+                self.logger.error("Volume anomaly detected: Z-Score %.2f > %s", z_score, threshold)
                 return True
             else:
-                self.logger.info(f"Volume check passed: Z-Score {z_score:.2f} <= {threshold}")
+                self.logger.info("Volume check passed: Z-Score %.2f <= %s", z_score, threshold)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Volume anomaly detection failed: {str(e)}")
+            self.logger.error("Volume anomaly detection failed: %s", e)
             return False
     
     def get_freshness_metrics(self) -> Optional[datetime]:
@@ -348,39 +388,48 @@ class ProductionDetectionEngine:
         """
         
         try:
-            with self._lock:
-                results = self.cdc_db.execute_query(query)
-                if results and results[0][0]:
-                    latest_timestamp = results[0][0]
-                    self.logger.info(f"Latest CDC timestamp: {latest_timestamp}")
-                    return latest_timestamp
-                else:
-                    self.logger.warning("No CDC timestamps found")
-                    return None
+            results = self.cdc_db.execute_prepared("detector_get_freshness", query)
+            if results and results[0][0]:
+                latest_timestamp = results[0][0]
+                self.logger.info("Latest CDC timestamp: %s", latest_timestamp)
+                return latest_timestamp
+            else:
+                self.logger.warning("No CDC timestamps found")
+                return None
         except Exception as e:
-            self.logger.error(f"Failed to get freshness metrics: {str(e)}")
+            self.logger.error("Failed to get freshness metrics: %s", e)
             return None
     
-    def check_freshness_anomaly(self) -> bool:
+    def check_freshness_anomaly(self, metrics: Optional[Dict[str, Any]] = None,
+                                now: Optional[datetime] = None) -> bool:
         """
         Freshness Check: Check time since last record
         
         Detection Logic: Time-since-last-record > threshold minutes indicates stale data
         Alerting: Logs STALE_DATA_FLOW alert to monitoring.alerts table
         
+        Args:
+            metrics: Cycle metrics from get_detection_metrics(); the latest CDC
+                     timestamp is queried directly if not provided
+            now: Detection cycle timestamp (UTC); defaults to the current time
+        
         Thread Safety: Thread-safe freshness monitoring
         """
         try:
             self.logger.info("Starting freshness anomaly detection")
             
             # Get latest CDC timestamp
-            latest_timestamp = self.get_freshness_metrics()
+            if metrics is not None:
+                latest_timestamp = metrics["latest_cdc_timestamp"]
+            else:
+                latest_timestamp = self.get_freshness_metrics()
             if not latest_timestamp:
                 self.logger.warning("Cannot perform freshness check: no timestamp data")
                 return False
             
             # Calculate time since last record
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             
             # Ensure latest_timestamp has timezone info
             if latest_timestamp.tzinfo is None:
@@ -413,46 +462,71 @@ class ProductionDetectionEngine:
                 self.alert_banner.print_critical_alert(
                     alert_type="STALE_DATA_FLOW",
                     description=f"Data flow is stale! No new records for {minutes_since_last:.1f} minutes (threshold: {threshold} minutes)",
-                    details=alert_details
+                    details=alert_details,
+                    timestamp=now
                 )
                 
-                self.logger.error(f"Freshness anomaly detected: {minutes_since_last:.1f} minutes > {threshold} minutes")
+                self.logger.error("Freshness anomaly detected: %.1f minutes > %s minutes", minutes_since_last, threshold)
                 return True
             else:
-                self.logger.info(f"Freshness check passed: {minutes_since_last:.1f} minutes <= {threshold} minutes")
+                self.logger.info("Freshness check passed: %.1f minutes <= %s minutes", minutes_since_last, threshold)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Freshness anomaly detection failed: {str(e)}")
+            self.logger.error("Freshness anomaly detection failed: %s", e)
             return False
     
     def log_alert(self, alert_type: str, description: str, source_table: Optional[str] = None,
                  metric_value: Optional[float] = None, threshold_value: Optional[float] = None,
                  z_score: Optional[float] = None, details: Optional[Dict] = None) -> bool:
         """
-        Log alert to monitoring.alerts table
+        Queue alert for monitoring.alerts table
         
-        Idempotency: UNIQUE constraint prevents duplicate alerts
+        Alerts are buffered per detection cycle and written by flush_alerts()
+        
+        Thread Safety: Pending alerts are guarded by the engine lock
+        """
+        try:
+            with self._lock:
+                details_json = _DETAILS_ENCODER.encode(details) if details else None
+                
+                self._pending_alerts.append(
+                    (alert_type, self.config.monitoring.alert_severity, description, source_table,
+                     metric_value, threshold_value, z_score, details_json)
+                )
+                self.logger.info("Alert queued: %s", alert_type)
+                return True
+        except Exception as e:
+            self.logger.error("Failed to queue alert: %s", e)
+            return False
+    
+    def flush_alerts(self) -> bool:
+        """
+        Write all queued alerts to monitoring.alerts table in one statement
+        
+        Idempotency: Alerts already raised this minute are skipped via ON CONFLICT
         
         Thread Safety: Uses thread-safe database manager
         """
         insert_query = """
         INSERT INTO monitoring.alerts 
         (alert_type, alert_severity, description, source_table, metric_value, threshold_value, z_score, details)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        VALUES %s
+        ON CONFLICT DO NOTHING
         """
         
+        with self._lock:
+            pending, self._pending_alerts = self._pending_alerts, []
+        
+        if not pending:
+            return True
+        
         try:
-            with self._lock:
-                details_json = json.dumps(details) if details else None
-                
-                self.cdc_db.execute_query(insert_query, 
-                                         (alert_type, self.config.monitoring.alert_severity, description, source_table,
-                                          metric_value, threshold_value, z_score, details_json))
-                self.logger.info(f"Alert logged to database: {alert_type}")
-                return True
+            self.cdc_db.execute_values(insert_query, pending)
+            self.logger.info("%s alerts logged to database", len(pending))
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to log alert: {str(e)}")
+            self.logger.error("Failed to log alerts: %s", e)
             return False
     
     def run_detection(self) -> Dict[str, bool]:
@@ -474,21 +548,30 @@ class ProductionDetectionEngine:
         try:
             self.logger.info("Starting production detection engine execution")
             
-            # Health check before starting
+            # Health check before any pooled connection is checked out: on
+            # repeated failures it may reinitialize (closeall) the pool
             health_status = self.db_manager.health_check()
             if not all(health_status.values()):
-                self.logger.warning(f"Database health check failed: {health_status}")
+                self.logger.warning("Database health check failed: %s", health_status)
+            
+            # Create alerts table once per process
+            if not self._alerts_table_ready:
+                if not self.create_alerts_table():
+                    return results
+                type(self)._alerts_table_ready = True
+            
+            # Fetch volume, baseline and freshness metrics in one round trip
+            metrics = self.get_detection_metrics()
             
-            # Create alerts table
-            if not self.create_alerts_table():
-                return results
+            # One timestamp for the whole detection cycle
+            cycle_now = datetime.now(timezone.utc)
             
             # Run volume anomaly detection
-            volume_result = self.check_volume_anomaly()
+            volume_result = self.check_volume_anomaly(metrics, now=cycle_now)
             results["volume_anomaly"] = volume_result
             
             # Run freshness anomaly detection
-            freshness_result = self.check_freshness_anomaly()
+            freshness_result = self.check_freshness_anomaly(metrics, now=cycle_now)
             results["freshness_anomaly"] = freshness_result
             
             # Calculate total anomalies
@@ -497,13 +580,16 @@ class ProductionDetectionEngine:
             if results["total_anomalies"] == 0:
                 self.logger.info("Detection completed: No anomalies detected")
             else:
-                self.logger.error(f"Detection completed: {results['total_anomalies']} anomalies detected")
+                self.logger.error("Detection completed: %s anomalies detected", results['total_anomalies'])
             
             return results
             
         except Exception as e:
-            self.logger.error(f"Detection execution failed: {str(e)}")
+            self.logger.error("Detection execution failed: %s", e)
             return results
+        finally:
+            # Write this cycle's alerts in a single round trip
+            self.flush_alerts()
     
     def get_detection_status(self) -> Dict[str, Any]:
         """
@@ -515,15 +601,13 @@ class ProductionDetectionEngine:
         try:
             # Get recent alert counts
             alert_query = """
-            SELECT alert_type, COUNT(*) as count, 
-                   MAX(alert_timestamp) as latest_timestamp
+            SELECT alert_type, COUNT(*) as count
             FROM monitoring.alerts
             WHERE alert_timestamp >= CURRENT_TIMESTAMP - INTERVAL '24 hours'
             GROUP BY alert_type
             """
             
-            with self._lock:
-                alert_results = self.cdc_db.execute_query(alert_query)
+            alert_results = self.cdc_db.execute_query(alert_query)
             
             # Get database status
             db_status = self.db_manager.get_status()
@@ -534,9 +618,9 @@ class ProductionDetectionEngine:
                 "database_status": db_status,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
-            
+        
         except Exception as e:
-            self.logger.error(f"Failed to get detection status: {str(e)}")
+            self.logger.error("Failed to get detection status: %s", e)
             return {
                 "detector_status": "error",
                 "error": str(e),
@@ -549,7 +633,7 @@ class ProductionDetectionEngine:
             self.db_manager.close_all()
             self.logger.info("Production detection engine cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
+            self.logger.error("Error during cleanup: %s", e)
 
 
 def main():
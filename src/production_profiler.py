@@ -13,12 +13,15 @@ Detection Logic:
 
 import logging
 import sys
-import statistics
-import threading
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Tuple, Optional, Any, Iterable
 from pathlib import Path
 
+import psycopg2.extras
+
 from config_manager import get_config
 from database_manager import get_database_manager
 
@@ -35,19 +38,44 @@ class ProductionMetricsProfiler:
     - Comprehensive error handling
     """
     
+    # Seconds a get_profiling_status result is served from memory
+    _STATUS_TTL_SECONDS = 30.0
+    
+    # Set once monitoring.baselines has been created/verified in this process
+    _monitoring_table_ready: bool = False
+    
+    _MONITORING_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS monitoring.baselines (
+        id SERIAL PRIMARY KEY,
+        metric_name VARCHAR(100) NOT NULL,
+        source_database VARCHAR(50) NOT NULL,
+        table_name VARCHAR(100) NOT NULL,
+        mean_value DECIMAL(15,4) NOT NULL,
+        std_deviation DECIMAL(15,4) NOT NULL,
+        sample_size INTEGER NOT NULL,
+        calculation_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(metric_name, source_database, table_name)
+    );
+    CREATE INDEX IF NOT EXISTS idx_baselines_lookup
+        ON monitoring.baselines (table_name, metric_name, calculation_timestamp DESC)
+        INCLUDE (mean_value, std_deviation, sample_size);
+    """
+    
     def __init__(self):
         """Initialize production metrics profiler"""
         self.config = get_config()
         self.db_manager = get_database_manager()
         self.logger = self._setup_logger()
         
-        # Thread safety
-        self._lock = threading.RLock()
-        
         # Get database connection managers
         self.batch_db = self.db_manager.get_connection_manager('batch')
         self.cdc_db = self.db_manager.get_connection_manager('cdc')
         
+        # (monotonic timestamp, status dict); run_profiling is the only writer
+        # of monitoring.baselines and resets this after each store
+        self._status_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._rollup_ready = False
+        
         self.logger.info("Production metrics profiler initialized")
     
     def _setup_logger(self) -> logging.Logger:
@@ -89,125 +117,245 @@ class ProductionMetricsProfiler:
         """
         Get daily row counts from fact_orders table in Batch DB
         
-        Detection Logic: CTE-based query for daily aggregation
+        Detection Logic: Single GROUP BY query for daily aggregation
         Schema: marts.fact_orders with order_timestamp column
+        Indexing: Expects an index on marts.fact_orders (order_timestamp)
         Returns: List of (date, row_count) tuples
         
         Thread Safety: Uses thread-safe database manager
         """
         query = """
-        WITH daily_counts AS (
-            SELECT 
-                DATE(order_timestamp) as order_date,
-                COUNT(*) as row_count
-            FROM marts.fact_orders
-            WHERE order_timestamp >= CURRENT_DATE - INTERVAL '%s days'
-            GROUP BY DATE(order_timestamp)
-        )
         SELECT 
-            order_date::date,
-            row_count
-        FROM daily_counts
+            DATE(order_timestamp) as order_date,
+            COUNT(*) as row_count
+        FROM marts.fact_orders
+        WHERE order_timestamp >= CURRENT_DATE - %s::interval
+        GROUP BY DATE(order_timestamp)
         ORDER BY order_date DESC
         """
         
         try:
-            with self._lock:
-                results = self.batch_db.execute_query(query, (days_back,))
-                self.logger.info(f"Retrieved {len(results)} daily row counts from Batch DB")
-                return results
+            results = self.batch_db.execute_query(query, (timedelta(days=days_back),))
+            self.logger.info("Retrieved %d daily row counts from Batch DB", len(results))
+            return results
                 
         except Exception as e:
-            self.logger.error(f"Failed to get batch daily row counts: {str(e)}")
+            self.logger.error("Failed to get batch daily row counts: %s", e)
             raise
     
     def get_cdc_hourly_ingestion_rates(self, hours_back: int = 24) -> List[Tuple]:
         """
         Get hourly ingestion rates from dim_orders_history table in CDC DB
         
-        Detection Logic: CTE-based query for hourly aggregation
+        Detection Logic: Single GROUP BY query for hourly aggregation
         Schema: public.dim_orders_history with created_at column
+        Indexing: Expects an index on dim_orders_history (created_at)
         Returns: List of (hour, ingestion_rate) tuples
         
         Thread Safety: Uses thread-safe database manager
         """
         query = """
-        WITH hourly_ingestion AS (
-            SELECT 
-                DATE_TRUNC('hour', created_at) as ingestion_hour,
-                COUNT(*) as records_ingested
-            FROM dim_orders_history
-            WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '%s hours'
-            GROUP BY DATE_TRUNC('hour', created_at)
-        )
         SELECT 
-            ingestion_hour,
-            records_ingested
-        FROM hourly_ingestion
+            DATE_TRUNC('hour', created_at) as ingestion_hour,
+            COUNT(*) as records_ingested
+        FROM dim_orders_history
+        WHERE created_at >= CURRENT_TIMESTAMP - %s::interval
+        GROUP BY DATE_TRUNC('hour', created_at)
         ORDER BY ingestion_hour DESC
         """
         
         try:
-            with self._lock:
-                results = self.cdc_db.execute_query(query, (hours_back,))
-                self.logger.info(f"Retrieved {len(results)} hourly ingestion rates from CDC DB")
-                return results
+            results = self.cdc_db.execute_query(query, (timedelta(hours=hours_back),))
+            self.logger.info("Retrieved %d hourly ingestion rates from CDC DB", len(results))
+            return results
+                
+        except Exception as e:
+            self.logger.error("Failed to get CDC hourly ingestion rates: %s", e)
+            raise
+    
+    def refresh_daily_rollup(self, days_back: int = 30) -> None:
+        """
+        Bring monitoring.fact_orders_daily up to date with completed days in Batch DB
+        
+        Detection Logic: Re-counts fact_orders from the latest stored day (to pick up
+        late rows) through yesterday and upserts one row per day; the first run
+        backfills the whole window
+        Schema: monitoring.fact_orders_daily (order_date, row_count) in Batch DB
+        
+        Thread Safety: Uses thread-safe database manager
+        """
+        create_rollup_query = """
+        CREATE SCHEMA IF NOT EXISTS monitoring;
+        CREATE TABLE IF NOT EXISTS monitoring.fact_orders_daily (
+            order_date DATE PRIMARY KEY,
+            row_count BIGINT NOT NULL,
+            refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        
+        refresh_query = """
+        INSERT INTO monitoring.fact_orders_daily (order_date, row_count)
+        SELECT 
+            DATE(order_timestamp) as order_date,
+            COUNT(*) as row_count
+        FROM marts.fact_orders
+        WHERE order_timestamp >= GREATEST(
+                (SELECT MAX(order_date) FROM monitoring.fact_orders_daily),
+                CURRENT_DATE - make_interval(days => %s))
+          AND order_timestamp < CURRENT_DATE
+        GROUP BY DATE(order_timestamp)
+        ON CONFLICT (order_date)
+        DO UPDATE SET 
+            row_count = EXCLUDED.row_count,
+            refreshed_at = CURRENT_TIMESTAMP
+        """
+        
+        try:
+            if not self._rollup_ready:
+                self.batch_db.execute_query(create_rollup_query, fetch=False)
+                self._rollup_ready = True
+            
+            self.batch_db.execute_query(refresh_query, (days_back,), fetch=False)
+            self.logger.info("Daily fact_orders rollup refreshed")
+        except Exception as e:
+            self.logger.error("Failed to refresh daily fact_orders rollup: %s", e)
+            raise
+    
+    def get_batch_daily_baseline(self, days_back: int = 30) -> Optional[Tuple[float, float, int]]:
+        """
+        Aggregate daily row counts from fact_orders into baseline statistics in Batch DB
+        
+        Detection Logic: AVG/STDDEV_SAMP over completed days from the daily rollup plus
+        today's live count, computed server-side
+        Performance: fact_orders is scanned only from the latest rolled-up day onward;
+        earlier days are read from monitoring.fact_orders_daily. Prepared once per pooled
+        connection; days_back is bound as $1
+        Schema: marts.fact_orders with order_timestamp column
+        Returns: Tuple of (mean, std_dev, sample_size) or None if no data
+        
+        Thread Safety: Uses thread-safe database manager
+        """
+        query = """
+        SELECT 
+            AVG(row_count),
+            COALESCE(STDDEV_SAMP(row_count), 0),
+            COUNT(*)
+        FROM (
+            SELECT row_count
+            FROM monitoring.fact_orders_daily
+            WHERE order_date >= CURRENT_DATE - make_interval(days => $1)
+            UNION ALL
+            SELECT COUNT(*) as row_count
+            FROM marts.fact_orders
+            WHERE order_timestamp >= CURRENT_DATE
+            HAVING COUNT(*) > 0
+        ) AS daily_counts
+        """
+        
+        self.refresh_daily_rollup(days_back)
+        return self._fetch_baseline(self.batch_db, "profiler_batch_daily", query, (days_back,),
+                                    "Batch DB daily row counts")
+    
+    def get_cdc_hourly_baseline(self, hours_back: int = 24) -> Optional[Tuple[float, float, int]]:
+        """
+        Aggregate hourly ingestion rates from dim_orders_history into baseline statistics in CDC DB
+        
+        Detection Logic: AVG/STDDEV_SAMP over an inline hourly ingestion subquery, computed server-side
+        Performance: Prepared once per pooled connection; hours_back is bound as $1
+        Schema: public.dim_orders_history with created_at column
+        Returns: Tuple of (mean, std_dev, sample_size) or None if no data
+        
+        Thread Safety: Uses thread-safe database manager
+        """
+        query = """
+        SELECT 
+            AVG(records_ingested),
+            COALESCE(STDDEV_SAMP(records_ingested), 0),
+            COUNT(*)
+        FROM (
+            SELECT COUNT(*) as records_ingested
+            FROM dim_orders_history
+            WHERE created_at >= CURRENT_TIMESTAMP - make_interval(hours => $1)
+            GROUP BY DATE_TRUNC('hour', created_at)
+        ) AS hourly_ingestion
+        """
+        
+        return self._fetch_baseline(self.cdc_db, "profiler_cdc_hourly", query, (hours_back,),
+                                    "CDC DB hourly ingestion rates")
+    
+    def _fetch_baseline(self, db, name: str, statement: str, params: Tuple,
+                        label: str) -> Optional[Tuple[float, float, int]]:
+        """Run a single-row (mean, std_dev, sample_size) aggregation as a prepared statement"""
+        try:
+            results = db.execute_prepared(name, statement, params)
+            mean_val, std_dev_val, sample_size = results[0]
+            if not sample_size:
+                self.logger.warning("No data found for %s", label)
+                return None
+            
+            self.logger.info("Calculated statistics for %s: mean=%.2f, std_dev=%.2f, samples=%d",
+                             label, float(mean_val), float(std_dev_val), sample_size)
+            return float(mean_val), float(std_dev_val), int(sample_size)
                 
         except Exception as e:
-            self.logger.error(f"Failed to get CDC hourly ingestion rates: {str(e)}")
+            self.logger.error("Failed to aggregate %s: %s", label, e)
             raise
     
-    def calculate_statistics(self, values: List[float]) -> Tuple[float, float]:
+    def calculate_statistics(self, values: Iterable[float]) -> Tuple[float, float]:
         """
         Calculate mean and standard deviation for Z-Score anomaly detection
         
-        Detection Logic: Standard statistical calculations for baseline metrics
+        Detection Logic: Welford's single-pass algorithm in float arithmetic, numerically
+        stable on wide ranges and usable on streamed values
         Returns: Tuple of (mean, std_dev)
         
         Thread Safety: Thread-safe calculation
         """
-        with self._lock:
-            if not values:
-                raise ValueError("No values provided for statistics calculation")
-            
-            try:
-                mean_val = statistics.mean(values)
-                std_dev_val = statistics.stdev(values) if len(values) > 1 else 0.0
-                
-                self.logger.info(f"Calculated statistics: mean={mean_val:.2f}, std_dev={std_dev_val:.2f}")
-                return mean_val, std_dev_val
-            except Exception as e:
-                self.logger.error(f"Statistics calculation failed: {str(e)}")
-                raise
+        count = 0
+        mean_val = 0.0
+        m2 = 0.0
+        
+        try:
+            for value in values:
+                value = float(value)
+                count += 1
+                delta = value - mean_val
+                mean_val += delta / count
+                m2 += (value - mean_val) * delta
+        except Exception as e:
+            self.logger.error("Statistics calculation failed: %s", e)
+            raise
+        
+        if count == 0:
+            raise ValueError("No values provided for statistics calculation")
+        
+        std_dev_val = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        
+        self.logger.info("Calculated statistics: mean=%.2f, std_dev=%.2f", mean_val, std_dev_val)
+        return mean_val, std_dev_val
     
     def create_monitoring_table(self) -> bool:
         """
         Create monitoring.baselines table if it doesn't exist
         
+        Indexing: Covering index on (table_name, metric_name, calculation_timestamp DESC)
+        serves the detector's latest-baseline lookup as an index-only scan
+        
+        Runs the DDL at most once per process; later calls return immediately
+        
         Thread Safety: Uses thread-safe database manager with retry logic
         """
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS monitoring.baselines (
-            id SERIAL PRIMARY KEY,
-            metric_name VARCHAR(100) NOT NULL,
-            source_database VARCHAR(50) NOT NULL,
-            table_name VARCHAR(100) NOT NULL,
-            mean_value DECIMAL(15,4) NOT NULL,
-            std_deviation DECIMAL(15,4) NOT NULL,
-            sample_size INTEGER NOT NULL,
-            calculation_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(metric_name, source_database, table_name)
-        )
-        """
+        if self._monitoring_table_ready:
+            return True
         
         try:
-            with self._lock:
-                # Use execute_query without fetch for DDL
-                self.cdc_db.execute_query(create_table_query, fetch=False)
-                self.logger.info("Monitoring table created/verified successfully")
-                return True
+            # Use execute_query without fetch for DDL
+            self.cdc_db.execute_query(self._MONITORING_TABLE_DDL, fetch=False)
+            type(self)._monitoring_table_ready = True
+            self.logger.info("Monitoring table created/verified successfully")
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to create monitoring table: {str(e)}")
+            self.logger.error("Failed to create monitoring table: %s", e)
             return False
     
     def store_baselines(self, metric_name: str, source_db: str, table_name: str, 
@@ -219,10 +367,27 @@ class ProductionMetricsProfiler:
         
         Thread Safety: Uses thread-safe database manager
         """
+        return self.store_baselines_batch([
+            (metric_name, source_db, table_name, mean_val, std_dev, sample_size)
+        ])
+    
+    def store_baselines_batch(self, rows: List[Tuple]) -> bool:
+        """
+        Store several calculated baselines in monitoring.baselines with one statement
+        
+        Idempotency: Multi-row UPSERT sent as a single execute_values round trip
+        and committed in one transaction; on first use in a process the table DDL
+        runs in that same transaction
+        
+        Thread Safety: Uses thread-safe database manager
+        """
+        if not rows:
+            return True
+        
         upsert_query = """
         INSERT INTO monitoring.baselines 
         (metric_name, source_database, table_name, mean_value, std_deviation, sample_size)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        VALUES %s
         ON CONFLICT (metric_name, source_database, table_name)
         DO UPDATE SET 
             mean_value = EXCLUDED.mean_value,
@@ -232,14 +397,18 @@ class ProductionMetricsProfiler:
         """
         
         try:
-            with self._lock:
-                self.cdc_db.execute_query(upsert_query, 
-                                         (metric_name, source_db, table_name, 
-                                          mean_val, std_dev, sample_size))
-                self.logger.info(f"Baseline stored for {metric_name} from {source_db}.{table_name}")
-                return True
+            with self.cdc_db.transaction() as cursor:
+                if not self._monitoring_table_ready:
+                    cursor.execute(self._MONITORING_TABLE_DDL)
+                psycopg2.extras.execute_values(cursor, upsert_query, rows, page_size=100)
+            
+            type(self)._monitoring_table_ready = True
+            self._status_cache = (0.0, None)
+            for row in rows:
+                self.logger.info("Baseline stored for %s from %s.%s", row[0], row[1], row[2])
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to store baseline: {str(e)}")
+            self.logger.error("Failed to store baselines: %s", e)
             return False
     
     def run_profiling(self) -> bool:
@@ -247,7 +416,7 @@ class ProductionMetricsProfiler:
         Main profiling execution method with thread safety and error handling
         
         Detection Logic: Orchestrates all profiling steps and stores baselines
-        Thread Safety: Thread-safe execution with proper locking
+        Thread Safety: Batch and CDC aggregations run concurrently on pooled connections
         
         Returns:
             True if profiling completed successfully, False otherwise
@@ -258,42 +427,54 @@ class ProductionMetricsProfiler:
             # Health check before starting
             health_status = self.db_manager.health_check()
             if not all(health_status.values()):
-                self.logger.warning(f"Database health check failed: {health_status}")
+                self.logger.warning("Database health check failed: %s", health_status)
             
-            # Create monitoring table
-            if not self.create_monitoring_table():
-                return False
+            # Aggregate both sources in parallel; each query uses its own pooled connection
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="profiler") as executor:
+                batch_future = executor.submit(self.get_batch_daily_baseline)
+                cdc_future = executor.submit(self.get_cdc_hourly_baseline)
+                batch_baseline = batch_future.result()
+                cdc_baseline = cdc_future.result()
+            
+            baseline_rows = []
             
-            # Profile Batch DB - Daily row counts
-            batch_counts = self.get_batch_daily_row_counts()
-            if batch_counts:
-                row_counts = [count[1] for count in batch_counts]
-                mean_rows, std_rows = self.calculate_statistics(row_counts)
-                self.store_baselines("daily_row_count", "batch_analytics_db", 
-                                   "marts.fact_orders", mean_rows, std_rows, len(row_counts))
+            # Profile Batch DB - Daily row counts, aggregated server-side
+            if batch_baseline:
+                mean_rows, std_rows, sample_size = batch_baseline
+                baseline_rows.append(("daily_row_count", "batch_analytics_db", 
+                                      "marts.fact_orders", mean_rows, std_rows, sample_size))
             
-            # Profile CDC DB - Hourly ingestion rates
-            cdc_rates = self.get_cdc_hourly_ingestion_rates()
-            if cdc_rates:
-                ingestion_rates = [rate[1] for rate in cdc_rates]
-                mean_ingestion, std_ingestion = self.calculate_statistics(ingestion_rates)
-                self.store_baselines("hourly_ingestion_rate", "cdc_history_db", 
-                                   "dim_orders_history", mean_ingestion, std_ingestion, len(ingestion_rates))
+            # Profile CDC DB - Hourly ingestion rates, aggregated server-side
+            if cdc_baseline:
+                mean_ingestion, std_ingestion, sample_size = cdc_baseline
+                baseline_rows.append(("hourly_ingestion_rate", "cdc_history_db", 
+                                      "dim_orders_history", mean_ingestion, std_ingestion, sample_size))
+            
+            # Create monitoring table (first run) and upsert both baselines in one transaction
+            if not self.store_baselines_batch(baseline_rows):
+                return False
             
             self.logger.info("Production profiling completed successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Production profiling execution failed: {str(e)}")
+            self.logger.error("Production profiling execution failed: %s", e)
             return False
     
     def get_profiling_status(self) -> Dict[str, Any]:
         """
         Get current profiling status and statistics
         
+        Caching: Served from memory for _STATUS_TTL_SECONDS; storing new
+        baselines invalidates the cached result
+        
         Returns:
             Dictionary with profiling status information
         """
+        cached_at, cached_status = self._status_cache
+        if cached_status is not None and time.monotonic() - cached_at < self._STATUS_TTL_SECONDS:
+            return cached_status
+        
         try:
             # Get baseline counts
             baseline_query = """
@@ -303,21 +484,22 @@ class ProductionMetricsProfiler:
             GROUP BY metric_name
             """
             
-            with self._lock:
-                baseline_results = self.cdc_db.execute_query(baseline_query)
+            baseline_results = self.cdc_db.execute_query(baseline_query)
             
             # Get database status
             db_status = self.db_manager.get_status()
             
-            return {
+            status = {
                 "profiler_status": "running",
                 "baseline_metrics": {row[0]: row[1] for row in baseline_results},
                 "database_status": db_status,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
+            self._status_cache = (time.monotonic(), status)
+            return status
             
         except Exception as e:
-            self.logger.error(f"Failed to get profiling status: {str(e)}")
+            self.logger.error("Failed to get profiling status: %s", e)
             return {
                 "profiler_status": "error",
                 "error": str(e),
@@ -330,7 +512,7 @@ class ProductionMetricsProfiler:
             self.db_manager.close_all()
             self.logger.info("Production profiler cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
+            self.logger.error("Error during cleanup: %s", e)
 
 
 def main():
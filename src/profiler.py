@@ -21,28 +21,34 @@ import statistics
 import os
 
 
+def _setup_module_logger() -> logging.Logger:
+    """Setup the shared profiler logger once at import time"""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    return logger
+
+
+# Shared by MetricsProfiler and every DatabaseConnection (as child loggers)
+_LOGGER = _setup_module_logger()
+
+
 class DatabaseConnection:
     """Modular database connection manager with comprehensive logging"""
     
     def __init__(self, config: Dict):
         self.config = config
         self.connection = None
-        self.logger = self._setup_logger()
-        
-    def _setup_logger(self) -> logging.Logger:
-        """Setup structured logging for database operations"""
-        logger = logging.getLogger(f"{self.config['name']}_connection")
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-        return logger
+        self.logger = _LOGGER.getChild(f"{self.config['name']}_connection")
     
     def connect(self) -> bool:
         """Establish database connection with error handling"""
@@ -51,10 +57,10 @@ class DatabaseConnection:
                 self.config['connection_string'],
                 connect_timeout=self.config.get('timeout', 30)
             )
-            self.logger.info(f"Successfully connected to {self.config['name']}")
+            self.logger.info("Successfully connected to %s", self.config['name'])
             return True
         except Exception as e:
-            self.logger.error(f"Failed to connect to {self.config['name']}: {str(e)}")
+            self.logger.error("Failed to connect to %s: %s", self.config['name'], e)
             return False
     
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Tuple]:
@@ -69,53 +75,38 @@ class DatabaseConnection:
             results = cursor.fetchall()
             cursor.close()
             
-            self.logger.info(f"Query executed successfully on {self.config['name']}, returned {len(results)} rows")
+            self.logger.info("Query executed successfully on %s, returned %d rows", self.config['name'], len(results))
             return results
             
         except Exception as e:
-            self.logger.error(f"Query failed on {self.config['name']}: {str(e)}")
+            self.logger.error("Query failed on %s: %s", self.config['name'], e)
             raise
     
     def close(self):
         """Close database connection"""
         if self.connection:
             self.connection.close()
-            self.logger.info(f"Connection closed to {self.config['name']}")
+            self.logger.info("Connection closed to %s", self.config['name'])
 
 
 class MetricsProfiler:
     """Multi-source metrics profiler for data observability"""
     
     def __init__(self, config_path: str = "observability_configs/databases.yaml"):
+        self.logger = _LOGGER
         self.config = self._load_config(config_path)
-        self.logger = self._setup_logger()
         self.batch_db = None
         self.cdc_db = None
         
-    def _setup_logger(self) -> logging.Logger:
-        """Setup structured logging for profiler operations"""
-        logger = logging.getLogger("metrics_profiler")
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-        return logger
-    
     def _load_config(self, config_path: str) -> Dict:
         """Load YAML configuration with error handling"""
         try:
             with open(config_path, 'r') as file:
                 config = yaml.safe_load(file)
-                self.logger.info(f"Configuration loaded from {config_path}")
+                self.logger.info("Configuration loaded from %s", config_path)
                 return config
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {str(e)}")
+            self.logger.error("Failed to load configuration: %s", e)
             raise
     
     def initialize_connections(self) -> bool:
@@ -135,7 +126,7 @@ class MetricsProfiler:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Connection initialization failed: {str(e)}")
+            self.logger.error("Connection initialization failed: %s", e)
             return False
     
     def get_batch_daily_row_counts(self, days_back: int = 30) -> List[Tuple]:
@@ -152,7 +143,7 @@ class MetricsProfiler:
                 DATE(order_timestamp) as order_date,
                 COUNT(*) as row_count
             FROM marts.fact_orders
-            WHERE order_timestamp >= CURRENT_DATE - INTERVAL '%s days'
+            WHERE order_timestamp >= CURRENT_DATE - %s::interval
             GROUP BY DATE(order_timestamp)
         )
         SELECT 
@@ -163,11 +154,11 @@ class MetricsProfiler:
         """
         
         try:
-            results = self.batch_db.execute_query(query, (days_back,))
-            self.logger.info(f"Retrieved {len(results)} daily row counts from Batch DB")
+            results = self.batch_db.execute_query(query, (timedelta(days=days_back),))
+            self.logger.info("Retrieved %d daily row counts from Batch DB", len(results))
             return results
         except Exception as e:
-            self.logger.error(f"Failed to get batch daily row counts: {str(e)}")
+            self.logger.error("Failed to get batch daily row counts: %s", e)
             raise
     
     def get_cdc_hourly_ingestion_rates(self, hours_back: int = 24) -> List[Tuple]:
@@ -184,7 +175,7 @@ class MetricsProfiler:
                 DATE_TRUNC('hour', created_at) as ingestion_hour,
                 COUNT(*) as records_ingested
             FROM dim_orders_history
-            WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '%s hours'
+            WHERE created_at >= CURRENT_TIMESTAMP - %s::interval
             GROUP BY DATE_TRUNC('hour', created_at)
         )
         SELECT 
@@ -195,11 +186,71 @@ class MetricsProfiler:
         """
         
         try:
-            results = self.cdc_db.execute_query(query, (hours_back,))
-            self.logger.info(f"Retrieved {len(results)} hourly ingestion rates from CDC DB")
+            results = self.cdc_db.execute_query(query, (timedelta(hours=hours_back),))
+            self.logger.info("Retrieved %d hourly ingestion rates from CDC DB", len(results))
             return results
         except Exception as e:
-            self.logger.error(f"Failed to get CDC hourly ingestion rates: {str(e)}")
+            self.logger.error("Failed to get CDC hourly ingestion rates: %s", e)
+            raise
+    
+    def compute_batch_baseline(self, days_back: int = 30) -> Optional[Tuple[float, float, int]]:
+        """
+        Compute daily row count baseline for fact_orders in Batch DB
+        
+        Detection Logic: AVG/STDDEV_SAMP/COUNT over daily counts, computed server-side
+        Schema: marts.fact_orders with order_timestamp column
+        Returns: Tuple of (mean, std_dev, sample_size) or None if no data
+        """
+        query = """
+        SELECT 
+            COALESCE(AVG(row_count), 0)::float8,
+            COALESCE(STDDEV_SAMP(row_count), 0)::float8,
+            COUNT(*)::int
+        FROM (
+            SELECT COUNT(*) as row_count
+            FROM marts.fact_orders
+            WHERE order_timestamp >= CURRENT_DATE - %s::interval
+            GROUP BY DATE(order_timestamp)
+        ) AS daily_counts
+        """
+        
+        try:
+            mean_val, std_dev_val, sample_size = self.batch_db.execute_query(query, (timedelta(days=days_back),))[0]
+            self.logger.info("Computed batch baseline: mean=%.2f, std_dev=%.2f, samples=%d",
+                             mean_val, std_dev_val, sample_size)
+            return (mean_val, std_dev_val, sample_size) if sample_size else None
+        except Exception as e:
+            self.logger.error("Failed to compute batch baseline: %s", e)
+            raise
+    
+    def compute_cdc_baseline(self, hours_back: int = 24) -> Optional[Tuple[float, float, int]]:
+        """
+        Compute hourly ingestion rate baseline for dim_orders_history in CDC DB
+        
+        Detection Logic: AVG/STDDEV_SAMP/COUNT over hourly counts, computed server-side
+        Schema: public.dim_orders_history with created_at column
+        Returns: Tuple of (mean, std_dev, sample_size) or None if no data
+        """
+        query = """
+        SELECT 
+            COALESCE(AVG(records_ingested), 0)::float8,
+            COALESCE(STDDEV_SAMP(records_ingested), 0)::float8,
+            COUNT(*)::int
+        FROM (
+            SELECT COUNT(*) as records_ingested
+            FROM dim_orders_history
+            WHERE created_at >= CURRENT_TIMESTAMP - %s::interval
+            GROUP BY DATE_TRUNC('hour', created_at)
+        ) AS hourly_ingestion
+        """
+        
+        try:
+            mean_val, std_dev_val, sample_size = self.cdc_db.execute_query(query, (timedelta(hours=hours_back),))[0]
+            self.logger.info("Computed CDC baseline: mean=%.2f, std_dev=%.2f, samples=%d",
+                             mean_val, std_dev_val, sample_size)
+            return (mean_val, std_dev_val, sample_size) if sample_size else None
+        except Exception as e:
+            self.logger.error("Failed to compute CDC baseline: %s", e)
             raise
     
     def calculate_statistics(self, values: List[float]) -> Tuple[float, float]:
@@ -214,12 +265,12 @@ class MetricsProfiler:
         
         try:
             mean_val = statistics.mean(values)
-            std_dev_val = statistics.stdev(values) if len(values) > 1 else 0.0
+            std_dev_val = statistics.stdev(values, xbar=mean_val) if len(values) > 1 else 0.0
             
-            self.logger.info(f"Calculated statistics: mean={mean_val:.2f}, std_dev={std_dev_val:.2f}")
+            self.logger.info("Calculated statistics: mean=%.2f, std_dev=%.2f", mean_val, std_dev_val)
             return mean_val, std_dev_val
         except Exception as e:
-            self.logger.error(f"Statistics calculation failed: {str(e)}")
+            self.logger.error("Statistics calculation failed: %s", e)
             raise
     
     def create_monitoring_table(self) -> bool:
@@ -243,7 +294,7 @@ class MetricsProfiler:
             self.logger.info("Monitoring table created/verified successfully")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to create monitoring table: {str(e)}")
+            self.logger.error("Failed to create monitoring table: %s", e)
             return False
     
     def store_baselines(self, metric_name: str, source_db: str, table_name: str, 
@@ -269,10 +320,10 @@ class MetricsProfiler:
             self.cdc_db.execute_query(upsert_query, 
                                      (metric_name, source_db, table_name, 
                                       mean_val, std_dev, sample_size))
-            self.logger.info(f"Baseline stored for {metric_name} from {source_db}.{table_name}")
+            self.logger.info("Baseline stored for %s from %s.%s", metric_name, source_db, table_name)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to store baseline: {str(e)}")
+            self.logger.error("Failed to store baseline: %s", e)
             return False
     
     def run_profiling(self) -> bool:
@@ -292,27 +343,25 @@ class MetricsProfiler:
             if not self.create_monitoring_table():
                 return False
             
-            # Profile Batch DB - Daily row counts
-            batch_counts = self.get_batch_daily_row_counts()
-            if batch_counts:
-                row_counts = [count[1] for count in batch_counts]
-                mean_rows, std_rows = self.calculate_statistics(row_counts)
+            # Profile Batch DB - Daily row counts, aggregated server-side
+            batch_baseline = self.compute_batch_baseline()
+            if batch_baseline:
+                mean_rows, std_rows, sample_size = batch_baseline
                 self.store_baselines("daily_row_count", "batch_analytics_db", 
-                                   "marts.fact_orders", mean_rows, std_rows, len(row_counts))
+                                   "marts.fact_orders", mean_rows, std_rows, sample_size)
             
-            # Profile CDC DB - Hourly ingestion rates
-            cdc_rates = self.get_cdc_hourly_ingestion_rates()
-            if cdc_rates:
-                ingestion_rates = [rate[1] for rate in cdc_rates]
-                mean_ingestion, std_ingestion = self.calculate_statistics(ingestion_rates)
+            # Profile CDC DB - Hourly ingestion rates, aggregated server-side
+            cdc_baseline = self.compute_cdc_baseline()
+            if cdc_baseline:
+                mean_ingestion, std_ingestion, sample_size = cdc_baseline
                 self.store_baselines("hourly_ingestion_rate", "cdc_history_db", 
-                                   "dim_orders_history", mean_ingestion, std_ingestion, len(ingestion_rates))
+                                   "dim_orders_history", mean_ingestion, std_ingestion, sample_size)
             
             self.logger.info("Multi-source profiling completed successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Profiling execution failed: {str(e)}")
+            self.logger.error("Profiling execution failed: %s", e)
             return False
         finally:
             # Cleanup connections
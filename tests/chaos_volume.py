@@ -14,8 +14,11 @@ Test Scenario:
 import sys
 import os
 import json
+import logging
 import yaml
+import functools
 import psycopg2
+from psycopg2.extras import execute_values, RealDictCursor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -25,6 +28,18 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 from profiler import MetricsProfiler
 from detector import DetectionEngine
 
+CONFIG_PATH = "config/databases.yaml"
+
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(config_path: str = CONFIG_PATH):
+    """Parse the database configuration once per process"""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class ChaosVolumeTest:
     """Chaos test for volume drop detection"""
@@ -33,7 +48,6 @@ class ChaosVolumeTest:
         self.logger = self._setup_logger()
         
     def _setup_logger(self):
-        import logging
         logger = logging.getLogger("chaos_volume_test")
         logger.setLevel(logging.INFO)
         
@@ -46,9 +60,8 @@ class ChaosVolumeTest:
         return logger
     
     def load_config(self):
-        """Load database configuration"""
-        with open("config/databases.yaml", 'r') as f:
-            return yaml.safe_load(f)
+        """Load database configuration (parsed once and cached)"""
+        return _load_config()
     
     def get_database_connection(self, config):
         """Get database connection"""
@@ -64,19 +77,18 @@ class ChaosVolumeTest:
     def setup_baseline(self, conn):
         """Setup baseline with normal volume (~20 records per hour)"""
         try:
-            cursor = conn.cursor()
-            
-            # Clear existing test data
-            cursor.execute("DELETE FROM monitoring.baselines WHERE metric_name = 'hourly_ingestion_rate'")
-            
-            # Insert baseline for normal volume
-            cursor.execute("""
-                INSERT INTO monitoring.baselines 
-                (metric_name, source_database, table_name, mean_value, std_deviation, sample_size)
-                VALUES ('hourly_ingestion_rate', 'cdc_history_db', 'dim_orders_history', 20.0, 5.0, 100)
-            """)
+            # Left uncommitted: run_test commits setup and simulation together
+            with conn.cursor() as cursor:
+                # Clear existing test data
+                cursor.execute("DELETE FROM monitoring.baselines WHERE metric_name = 'hourly_ingestion_rate'")
+                
+                # Insert baseline for normal volume
+                cursor.execute("""
+                    INSERT INTO monitoring.baselines 
+                    (metric_name, source_database, table_name, mean_value, std_deviation, sample_size)
+                    VALUES ('hourly_ingestion_rate', 'cdc_history_db', 'dim_orders_history', 20.0, 5.0, 100)
+                """)
             
-            conn.commit()
             self.logger.info("✅ Baseline setup: 20.0 ± 5.0 records per hour")
             return True
             
@@ -87,30 +99,37 @@ class ChaosVolumeTest:
     def simulate_volume_drop(self, conn):
         """Simulate volume drop with only 2 records"""
         try:
-            cursor = conn.cursor()
-            
-            # Clear existing dim_orders_history records
-            cursor.execute("DELETE FROM dim_orders_history WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '2 hours'")
-            
-            # Insert only 2 records (90% drop from baseline)
-            test_records = [
-                (1001, 101, 201, 2, 29.99, 59.98, 'completed', datetime.now(timezone.utc) - timedelta(minutes=55)),
-                (1002, 102, 202, 1, 49.99, 49.99, 'pending', datetime.now(timezone.utc) - timedelta(minutes=30))
-            ]
-            
-            for record in test_records:
-                order_key, customer_id, product_id, quantity, unit_price, total_amount, order_status, order_date = record
-                cursor.execute("""
+            with conn.cursor() as cursor:
+                # One clock read for every timestamp in this run
+                now = datetime.now(timezone.utc)
+                
+                # Clear existing dim_orders_history records
+                cursor.execute("DELETE FROM dim_orders_history WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '2 hours'")
+                
+                # Insert only 2 records (90% drop from baseline)
+                test_records = [
+                    (1001, 101, 201, 2, 29.99, 59.98, 'completed', now - timedelta(minutes=55)),
+                    (1002, 102, 202, 1, 49.99, 49.99, 'pending', now - timedelta(minutes=30))
+                ]
+                
+                # Full rows are built lazily as execute_values pages through them
+                rows = (
+                    (order_key, customer_id, product_id, quantity, unit_price, total_amount, 
+                     order_status, order_date, order_date, None, True, 'INSERT', 
+                     now, now)
+                    for order_key, customer_id, product_id, quantity, unit_price, total_amount,
+                    order_status, order_date in test_records
+                )
+                
+                # Insert all records in a single statement
+                execute_values(cursor, """
                     INSERT INTO dim_orders_history 
                     (order_key, customer_id, product_id, quantity, unit_price, total_amount, 
                      order_status, order_date, valid_from, valid_to, is_current, cdc_operation, 
                      cdc_timestamp, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (order_key, customer_id, product_id, quantity, unit_price, total_amount, 
-                      order_status, order_date, order_date, None, True, 'INSERT', 
-                      datetime.now(timezone.utc), datetime.now(timezone.utc)))
+                    VALUES %s
+                """, rows, page_size=1000)
             
-            conn.commit()
             self.logger.info("🔥 Volume drop simulated: Only 2 records (90% drop from baseline)")
             return True
             
@@ -140,30 +159,16 @@ class ChaosVolumeTest:
             self.logger.error(f"Detection test failed: {e}")
             return False
     
-    def verify_alert_in_database(self, config):
-        """Verify that alert was logged to database"""
+    def verify_alert_in_database(self, conn):
+        """Verify that alert was logged to database, reusing the test's connection"""
         try:
-            conn = psycopg2.connect(config['databases']['cdc_history_db']['connection_string'])
-            cursor = conn.cursor()
-            
-            # Check for VOLUME_ANOMALY alerts in last hour
-            cursor.execute("""
-                SELECT alert_type, description, alert_timestamp, details
-                FROM monitoring.alerts 
-                WHERE alert_type = 'VOLUME_ANOMALY' 
-                AND alert_timestamp >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
-                ORDER BY alert_timestamp DESC
-                LIMIT 5
-            """)
-            
-            alerts = cursor.fetchall()
-            conn.close()
+            found = 0
+            for alert in self._iter_volume_alerts(conn):
+                found += 1
+                self.logger.info("  - %s at %s", alert['description'], alert['alert_timestamp'])
             
-            if alerts:
-                self.logger.info(f"✅ Found {len(alerts)} VOLUME_ANOMALY alerts in database")
-                for alert in alerts:
-                    alert_type, description, timestamp, details = alert
-                    self.logger.info(f"  - {description} at {timestamp}")
+            if found:
+                self.logger.info("✅ Found %d VOLUME_ANOMALY alerts in database", found)
                 return True
             else:
                 self.logger.error("❌ No VOLUME_ANOMALY alerts found in database")
@@ -173,14 +178,35 @@ class ChaosVolumeTest:
             self.logger.error(f"Failed to verify alerts in database: {e}")
             return False
     
+    def _iter_volume_alerts(self, conn, itersize=100):
+        """
+        Stream the latest VOLUME_ANOMALY alerts from the last hour as dict rows
+        
+        Uses a named (server-side) cursor, so rows arrive in itersize pages
+        instead of being materialized with fetchall.
+        """
+        with conn.cursor(name='volume_alert_stream', cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = itersize
+            cursor.execute("""
+                SELECT description, alert_timestamp
+                FROM monitoring.alerts 
+                WHERE alert_type = 'VOLUME_ANOMALY' 
+                AND alert_timestamp >= CURRENT_TIMESTAMP - INTERVAL '1 hour'
+                ORDER BY alert_timestamp DESC
+                LIMIT 5
+            """)
+            yield from cursor
+    
     def cleanup_test_data(self, conn):
         """Clean up test data"""
         try:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM monitoring.baselines WHERE metric_name = 'hourly_ingestion_rate'")
-            cursor.execute("DELETE FROM monitoring.alerts WHERE alert_type = 'VOLUME_ANOMALY'")
-            cursor.execute("DELETE FROM dim_orders_history WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '2 hours'")
-            conn.commit()
+            with conn, conn.cursor() as cursor:
+                # All three deletes go to the server in a single round trip
+                cursor.execute("""
+                    DELETE FROM monitoring.baselines WHERE metric_name = 'hourly_ingestion_rate';
+                    DELETE FROM monitoring.alerts WHERE alert_type = 'VOLUME_ANOMALY';
+                    DELETE FROM dim_orders_history WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '2 hours';
+                """)
             self.logger.info("🧹 Test data cleaned up")
         except Exception as e:
             self.logger.error(f"Failed to cleanup: {e}")
@@ -200,19 +226,18 @@ class ChaosVolumeTest:
                 return False
             
             try:
-                # Step 1: Setup baseline
-                if not self.setup_baseline(conn):
-                    return False
-                
-                # Step 2: Simulate volume drop
-                if not self.simulate_volume_drop(conn):
+                # Steps 1-2: Setup baseline and simulate volume drop in one
+                # transaction, committed once before detection reads it
+                if not (self.setup_baseline(conn) and self.simulate_volume_drop(conn)):
+                    conn.rollback()
                     return False
+                conn.commit()
                 
                 # Step 3: Run detection test
                 detection_success = self.run_detection_test()
                 
                 # Step 4: Verify database alerts
-                db_success = self.verify_alert_in_database(config)
+                db_success = self.verify_alert_in_database(conn)
                 
                 # Overall test result
                 test_success = detection_success and db_success